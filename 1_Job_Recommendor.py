@@ -1,131 +1,37 @@
 import streamlit as st
-from PyPDF2 import PdfReader
 from dotenv import load_dotenv
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import DeepLake
 from langchain.memory import ConversationBufferMemory
 from langchain.chains import ConversationalRetrievalChain
 from langchain_openai import ChatOpenAI
+from utils.embedding_cache import CachedEmbeddings, get_embedding_store
+from utils.llm_cache import get_response_cache
+from utils.pdf_text import PdfLimitError
+from utils.resume_profile import load_resume_profile, profile_embeddings
+from utils.streaming import StreamHandler
+from utils.theme import apply_theme
+from utils.vector_index import session_vectorstore
 
 st.set_page_config(page_title="Candidate AI", page_icon="🧠")
 
-Page_style = """
-    <style>
-    [data-testid="stHeader"] {
-        background: rgba(0,0,0,0);
-    }
-   
-    /* Background and text styling to match the animation theme */
-    [data-testid="stAppViewContainer"] {
-        background-color: #1e1e2f; /* Dark background to match the animation */
-        color: #f0f0f7; /* Light text color for contrast */
-    }
-    h1, h2, h3, h4, h5, h6, p, a, label {
-        color: #f0f0f7 !important; /* Light color for headers and text */
-    }
-     [data-testid="stSidebarCollapseButton"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-    [data-testid="stSidebarContent"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-    .st-emotion-cache-1itdyc2{
-       background-color: #304463; 
-    }
-       [data-testid="stSidebarNav"] {
-        background-color: #304463; /* Dark background for sidebar */
-        ; /* Add padding around the sidebar */
-        border-radius: 10px; /* Rounded corners for a smooth look */
-    }
-
-    /* Styling each navigation link */
-    [data-testid="stSidebarNavLink"] {
-        background-color:black; /* Darker background for each link */
-        color: #f0f0f7 !important; /* Light text color */
-        padding: 12px 20px; /* Add padding to the links */
-        border-radius: 8px; /* Rounded corners for links */
-        text-decoration: none; /* Remove underline */
-        display: block; /* Make the link take full width */
-        margin-bottom: 10px; /* Space between links */
-        transition: background-color 0.3s ease; /* Smooth transition */
-    }
-.st-emotion-cache-6qob1r {
-    position: relative;
-    height: 100%;
-    width: 100%;
-    overflow: overlay;}
-    /* Styling the hover effect on the navigation links */
-    [data-testid="stSidebarNavLink"]:hover {
-        background-color: #3d3d5c; /* Slightly lighter background on hover */
-    }
-
-    /* Styling the text inside the navigation links */
-    [data-testid="stSidebarNavLink"] span {
-        font-weight: bold; /* Make the text bold */
-        font-size: 16px; /* Slightly larger font size */
-    }
-
-    /* Remove the default list style */
-    [data-testid="stSidebarNavItems"] {
-        list-style-type: none;
-        padding: 0;
-    }
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 12px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #2e2e3e;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background-color: #555555;
-        border-radius: 6px;
-        border: 3px solid #2e2e3e;
-    }
-    .MuiBox-root ,.css-0{
-    background-color:#1e1e2f;
-    }
-    </style>
-"""
-st.markdown(Page_style,unsafe_allow_html=True)
+apply_theme()
 
 load_dotenv()
 
-def get_pdf_text(pdf):
-    text = ""
-    pdfReader = PdfReader(pdf)
-    for page in pdfReader.pages:
-        text += page.extract_text()
-    return text
+def get_vectorstore(profile):
+    embedding = CachedEmbeddings(OpenAIEmbeddings())
+    return session_vectorstore(profile.chunks, embedding, profile_embeddings(profile, embedding))
 
-def get_text_chunks(text):
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=750,
-        chunk_overlap=50,
-        length_function=len
-    )
-    chunks = text_splitter.split_text(text)
-    return chunks
-
-def get_vectorstore(text_chunks):
-    dataset_path = "./my_deeplake_candidate/"
-    vectorstore = DeepLake.from_texts(text_chunks,dataset_path=dataset_path, embedding=OpenAIEmbeddings())
-    return vectorstore
-
-def get_conversation_chain(vectorstore):
-    llm = ChatOpenAI(model="gpt-4o")
+def get_conversation_chain(vectorstore, use_cache=True, stream_handler=None):
+    cache = get_response_cache("job_recommender") if use_cache else False
+    # Only the answering model streams; follow-up question rewriting stays silent
+    llm = ChatOpenAI(model="gpt-4o", cache=cache, callbacks=[stream_handler] if stream_handler else None)
     memory = ConversationBufferMemory(memory_key='chat_history',return_messages=True)
     conversation_chain = ConversationalRetrievalChain.from_llm(
         llm=llm,
         memory=memory,
         retriever=vectorstore.as_retriever(),
+        condense_question_llm=ChatOpenAI(model="gpt-4o", cache=cache),
     )
     return conversation_chain
 
@@ -143,24 +49,27 @@ def main():
 
     st.header('Job Recommender')
     st.subheader('AI Based Job Recommendation system to analyse job seeker profiles and find suitable job opportunities for the particular resume.')
+    answer_placeholder = st.empty()
 
     with st.sidebar:
         st.subheader('Your Resume')
         pdf = st.file_uploader('Upload your resume:')
         if st.button('Process'):
             with st.spinner('Processing...'):
-                raw_text = get_pdf_text(pdf)
-
-                text_chunks = get_text_chunks(raw_text)
-
-                vectorstore = get_vectorstore(text_chunks)
-
-                st.session_state.conversation = get_conversation_chain(vectorstore)
-                handle_defaultinput('Suggest best suited job for this resume by providing the two best job options and expected salary in rupees in about 50 words')
-                DeepLake.force_delete_by_path("./my_deeplake_candidate")
+                try:
+                    profile = load_resume_profile(pdf)
+                except PdfLimitError as e:
+                    st.error(str(e))
+                else:
+                    with get_vectorstore(profile) as vectorstore:
+                        st.session_state.conversation = get_conversation_chain(vectorstore, stream_handler=StreamHandler(answer_placeholder))
+                        handle_defaultinput('Suggest best suited job for this resume by providing the two best job options and expected salary in rupees in about 50 words')
+            cache_stats = get_embedding_store().stats()
+            st.caption(f"Embedding cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses")
+            st.caption(f"Response cache hit rate: {get_response_cache('job_recommender').stats()['hit_rate']:.0%}")
         st.divider()
     
-    st.write(st.session_state.response1)
+    answer_placeholder.write(st.session_state.response1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,162 +1,109 @@
 import streamlit as st
+import streamlit.components.v1 as components
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
-from langchain_core.output_parsers import StrOutputParser, PydanticOutputParser
+from langchain_core.prompts import PromptTemplate
 from pydantic import BaseModel, Field
-from typing import List
+from utils.llm_cache import get_response_cache
+from utils.question_bank import QUESTIONS_PER_TEST, Questions, get_question_bank
+from utils.theme import apply_theme
 from datetime import datetime, timedelta
 import os
-import time
 st.set_page_config(page_title="Job Interview Simulator", page_icon="📈")
-Page_style = """
-    <style>
-    [data-testid="stHeader"] {
-        background: rgba(0,0,0,0);
-    }
-   
-    /* Background and text styling to match the animation theme */
-    [data-testid="stAppViewContainer"] {
-        background-color: #1e1e2f; /* Dark background to match the animation */
-        color: #f0f0f7; /* Light text color for contrast */
-    }
-    h1, h2, h3, h4, h5, h6, p, a, label {
-        color: #f0f0f7 !important; /* Light color for headers and text */
-    }
-     [data-testid="stSidebarCollapseButton"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-     [data-testid="stSidebarContent"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-    .st-emotion-cache-1itdyc2{
-       background-color: #304463; 
-    }
-       [data-testid="stSidebarNav"] {
-        background-color: #304463; /* Dark background for sidebar */
-        ; /* Add padding around the sidebar */
-        border-radius: 10px; /* Rounded corners for a smooth look */
-    }
-
-    /* Styling each navigation link */
-    [data-testid="stSidebarNavLink"] {
-        background-color:black; /* Darker background for each link */
-        color: #f0f0f7 !important; /* Light text color */
-        padding: 12px 20px; /* Add padding to the links */
-        border-radius: 8px; /* Rounded corners for links */
-        text-decoration: none; /* Remove underline */
-        display: block; /* Make the link take full width */
-        margin-bottom: 10px; /* Space between links */
-        transition: background-color 0.3s ease; /* Smooth transition */
-    }
-.st-emotion-cache-6qob1r {
-    position: relative;
-    height: 100%;
-    width: 100%;
-    overflow: overlay;}
-    /* Styling the hover effect on the navigation links */
-    [data-testid="stSidebarNavLink"]:hover {
-        background-color: #3d3d5c; /* Slightly lighter background on hover */
-    }
-
-    /* Styling the text inside the navigation links */
-    [data-testid="stSidebarNavLink"] span {
-        font-weight: bold; /* Make the text bold */
-        font-size: 16px; /* Slightly larger font size */
-    }
-
-    /* Remove the default list style */
-    [data-testid="stSidebarNavItems"] {
-        list-style-type: none;
-        padding: 0;
-    }
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 12px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #2e2e3e;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background-color: #555555;
-        border-radius: 6px;
-        border: 3px solid #2e2e3e;
-    }
-    .MuiBox-root ,.css-0{
-    background-color:#1e1e2f;
-    }
-    </style>
-"""
-st.markdown(Page_style,unsafe_allow_html=True)
+apply_theme()
 
 load_dotenv()
 openai_api_key = os.getenv("OPENAI_API_KEY")
-model = ChatOpenAI(model="gpt-4o-mini", api_key=openai_api_key)
-
+# Scoring is deterministic, so identical answers are served from the response cache
+model = ChatOpenAI(model="gpt-4o-mini", api_key=openai_api_key, temperature=0, cache=get_response_cache("interview_simulator"))
 
 def generate_questions(job_role, work_experience):
-    system_template = (
-        "You are an intelligent competency diagnostic system. Ask a series of questions to the job seeker "
-        "to test their competence, and based on their scores, recommend jobs to them."
-    )
-    human_prompt = f"Assume the given job seeker is a {job_role} with {work_experience} years of experience. Generate a set of 5 questions to test their competence."
-    prompt_template = ChatPromptTemplate.from_messages([("system", system_template), ("user", human_prompt)])
-    parser = StrOutputParser()
-    chain = prompt_template | model | parser
-
+    # Served from the pre-generated pool for this role and experience bucket
     try:
-        response = chain.invoke({"job_role": job_role, "work_experience": work_experience})
-        return response
+        return Questions(set_of_questions=get_question_bank().draw(job_role, work_experience))
     except Exception as e:
         st.error(f"Error generating questions: {e}")
-        return ""
+        return None
 
-def get_questions(context):
-    class Questions(BaseModel):
-        set_of_questions: List[str] = Field(description="List of questions to test the competence of the job seeker")
+class AnswerScore(BaseModel):
+    score: int = Field(ge=0, le=5, description="Score for the answer, from 0 to 5 points")
+    rationale: str = Field(description="One or two sentences explaining the score")
 
-    parser = PydanticOutputParser(pydantic_object=Questions)
-    format_instructions = parser.get_format_instructions()
-    human_prompt = f"Here is the context: {context}. Extract the set of questions from the given context to test the competence of the job seeker. Generate the questions in the following format: {format_instructions}"
+def score_answers(answers, job_role, work_experience):
     prompt = PromptTemplate(
-        template="You are an intelligent information extractor. Extract the set of questions from the given context to test the competence of the job seeker in a List format.\n{format_instructions}\n{human_prompt}\n",
-        input_variables=["human_prompt"],
-        partial_variables={"format_instructions": parser.get_format_instructions()},
+        template="You are an intelligent competency diagnostic system. Score the answer of a job seeker who is a {job_role} with {work_experience} years of experience.\nQuestion: {question}\nAnswer: {answer}\nGive a score out of 5 points and a short rationale.",
+        input_variables=["job_role", "work_experience", "question", "answer"],
     )
-    chain = prompt | model | parser
-
-    try:
-        response = chain.invoke({"human_prompt": human_prompt})
-        return response
-    except Exception as e:
-        st.error(f"Error extracting questions: {e}")
-        return ""
+    chain = prompt | model.with_structured_output(AnswerScore)
+
+    # Blank answers score zero without a model call; the rest are scored concurrently
+    answered = [(q, a) for q, a in answers.items() if a.strip()]
+    results = chain.batch(
+        [{"job_role": job_role, "work_experience": work_experience, "question": q, "answer": a} for q, a in answered],
+        config={"max_concurrency": max(1, len(answered))},
+        return_exceptions=True,
+    ) if answered else []
+    scored = dict(zip((q for q, _ in answered), results))
+
+    scores = []
+    for question in answers:
+        result = scored.get(question, AnswerScore(score=0, rationale="No answer was given."))
+        if isinstance(result, Exception):
+            result = AnswerScore(score=0, rationale=f"Could not be scored: {result}")
+        scores.append({"question": question, "score": result.score, "rationale": result.rationale})
+    return scores
 
 def calculate_score(answers, job_role, work_experience):
-    human_prompt = f"Assume the given job seeker is a {job_role} with {work_experience} years of experience. Calculate the score of the job seeker based on their answers to the questions. Here is the set of answers provided by the job seeker for each question: {answers}. Each question can be scored out of 5 points, leading to a maximum possible score of 25 points as only a set of 5 questions and answers are provided."
-    prompt = PromptTemplate(
-        template="You are an intelligent competency diagnostic system. You are required to calculate the score of the job seeker based on their answers to the questions based on their job role and work experience.\n{human_prompt}",
-        input_variables=["human_prompt"],
-    )
-    parser = StrOutputParser()
-    chain = prompt | model | parser
-
     try:
-        response = chain.invoke({"human_prompt": human_prompt})
-        return response
+        return score_answers(answers, job_role, work_experience)
     except Exception as e:
         st.error(f"Error generating scores: {e}")
-        return ""
+        return []
+
+def show_scores(scores):
+    total = sum(item["score"] for item in scores)
+    st.metric("Total score", f"{total} / {5 * len(scores)}")
+    st.bar_chart([{"Question": f"Q{i}", "Score": item["score"]} for i, item in enumerate(scores, start=1)], x="Question", y="Score")
+    for i, item in enumerate(scores, start=1):
+        with st.expander(f"Q{i}: {item['score']} / 5"):
+            st.write(item["question"])
+            st.caption(item["rationale"])
+
+# Countdown drawn by the browser, so the server does no work while the candidate is answering
+TIMER_HTML = """
+<div style="font-family: sans-serif; color: #f0f0f7;">
+    <div id="timer">⏳ Time remaining: --:--</div>
+    <div style="background: #2e2e3e; border-radius: 6px; height: 8px; margin-top: 8px;">
+        <div id="bar" style="background: #ff4b4b; border-radius: 6px; height: 8px; width: 0%%;"></div>
+    </div>
+</div>
+<script>
+    const deadline = Date.now() + %(remaining_ms)d;
+    const limit = %(limit_ms)d;
+    function tick() {
+        const left = Math.max(0, deadline - Date.now());
+        const seconds = Math.ceil(left / 1000);
+        const mm = String(Math.floor(seconds / 60)).padStart(2, "0");
+        const ss = String(seconds %% 60).padStart(2, "0");
+        document.getElementById("timer").textContent = left > 0 ? `⏳ Time remaining: ${mm}:${ss}` : "⏳ Time's up! Submitting your answers automatically...";
+        document.getElementById("bar").style.width = `${100 * (1 - left / limit)}%%`;
+        if (left > 0) setTimeout(tick, 250);
+    }
+    tick();
+</script>
+"""
 
-def format_remaining_time(remaining_time):
-    minutes, seconds = divmod(remaining_time.seconds, 60)
-    return f"{minutes:02}:{seconds:02}"
+def render_timer(remaining_time, time_limit):
+    components.html(TIMER_HTML % {
+        "remaining_ms": remaining_time.total_seconds() * 1000,
+        "limit_ms": time_limit.total_seconds() * 1000,
+    }, height=50)
+
+def submit_answers():
+    st.session_state.final_answers = {q: st.session_state.get(q, '') for q in st.session_state.questions}
+    response = calculate_score(st.session_state.final_answers, st.session_state.job_role, st.session_state.work)
+    st.session_state.questions.clear()
+    st.session_state.response = response
 
 def main():
     if 'questions' not in st.session_state:
@@ -186,9 +133,8 @@ def main():
     col1, col2 = st.columns([3, 1])
     with col1:
         if st.button("Generate Questions"):
-            response = generate_questions(st.session_state.job_role, st.session_state.work)
-            res = get_questions(response)
-            if len(res.set_of_questions) == 5:
+            res = generate_questions(st.session_state.job_role, st.session_state.work)
+            if res and len(res.set_of_questions) == QUESTIONS_PER_TEST:
                 st.session_state.questions = res.set_of_questions
                 st.session_state.start_time = datetime.now()
                 st.session_state.end_time = st.session_state.start_time + st.session_state.time_limit
@@ -200,40 +146,33 @@ def main():
             st.rerun()
 
     if st.session_state.response:
-        st.write(st.session_state.response)
+        show_scores(st.session_state.response)
     
     if st.session_state.questions:
         remaining_time = st.session_state.end_time - datetime.now()
-        timer_placeholder = st.empty()
-        progress_placeholder = st.empty()
+        # Expiry is enforced against end_time on whichever run comes first after it passes
+        if remaining_time <= timedelta(seconds=0):
+            st.write("⏳ Time's up! Submitting your answers automatically...")
+            submit_answers()
+            st.rerun()
+
+        render_timer(remaining_time, st.session_state.time_limit)
         for question in st.session_state.questions:
             st.write(question)
             answer = st.text_input("Enter your answer", key=question)
             st.session_state.final_answers[question] = answer
 
         if st.button("Submit Answers"):
-            response = calculate_score(st.session_state.final_answers, st.session_state.job_role, st.session_state.work)
-            st.session_state.questions.clear()
-            st.session_state.response = response
+            submit_answers()
             st.rerun()
 
-        while remaining_time > timedelta(seconds=0):
-            remaining_time = st.session_state.end_time - datetime.now()
-            if remaining_time <= timedelta(seconds=0):
-                st.write("⏳ Time's up! Submitting your answers automatically...")
-                st.session_state.final_answers = {q: st.session_state.final_answers.get(q, '') for q in st.session_state.questions}
-                
-                response = calculate_score(st.session_state.final_answers, st.session_state.job_role, st.session_state.work)
-                st.session_state.questions.clear()
-                st.session_state.response = response
+        # Single wake-up at the deadline so an idle candidate is still auto-submitted
+        @st.fragment(run_every=remaining_time + timedelta(seconds=1))
+        def expiry_watch():
+            if datetime.now() >= st.session_state.end_time:
                 st.rerun()
-                break
-
-            timer_placeholder.markdown(f"⏳ Time remaining: {format_remaining_time(remaining_time)}")
-            time_percentage = (st.session_state.time_limit - remaining_time) / st.session_state.time_limit
-            progress_placeholder.progress(time_percentage, text=f"Time remaining: {format_remaining_time(remaining_time)}")
 
-            time.sleep(1)
+        expiry_watch()
     else:
         st.info("Generate questions to start the test.")
 
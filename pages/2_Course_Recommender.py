@@ -1,187 +1,120 @@
-import base64
-import os
-import requests
+import re
 import streamlit as st
 from dotenv import load_dotenv
 from langchain.chains import ConversationalRetrievalChain
 from langchain.memory import ConversationBufferMemory
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import DeepLake
 from langchain_google_genai import (ChatGoogleGenerativeAI,
                                     GoogleGenerativeAIEmbeddings)
-from PyPDF2 import PdfReader
+from utils.course_cache import get_course_client
+from utils.embedding_cache import CachedEmbeddings, get_embedding_store
+from utils.llm_cache import get_response_cache
+from utils.pdf_text import PdfLimitError
+from utils.resume_profile import (load_resume_profile, profile_embeddings,
+                                  set_profile_skills)
+from utils.streaming import StreamHandler
+from utils.theme import apply_theme
+from utils.vector_index import session_vectorstore
 
 load_dotenv()
 
-page_style = """
-    <style>
-    [data-testid="stHeader"] {
-        background: rgba(0,0,0,0);
-    }
-   
-    /* Background and text styling to match the animation theme */
-    [data-testid="stAppViewContainer"] {
-        background-color: #1e1e2f; /* Dark background to match the animation */
-        color: #f0f0f7; /* Light text color for contrast *//
-    }
-    h1, h2, h3, h4, h5, h6, p, a, label {
-        color: #f0f0f7 !important; /* Light color for headers and text */
-    }
-     [data-testid="stSidebarCollapseButton"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-    [data-testid="stSidebarContent"]{
-        background-color: #304463; /* Bright button color */
-        color: #ffffff; /* White text on buttons */
-        
-    }
-    .st-emotion-cache-1itdyc2{
-       background-color: #304463; 
-    }
-       [data-testid="stSidebarNav"] {
-        background-color: #304463; /* Dark background for sidebar */
-        ; /* Add padding around the sidebar */
-        border-radius: 10px; /* Rounded corners for a smooth look */
-    }
+LLM_MODEL = "gemini-1.5-flash"
 
-    /* Styling each navigation link */
-    [data-testid="stSidebarNavLink"] {
-        background-color:black; /* Darker background for each link */
-        color: #f0f0f7 !important; /* Light text color */
-        padding: 12px 20px; /* Add padding to the links */
-        border-radius: 8px; /* Rounded corners for links */
-        text-decoration: none; /* Remove underline */
-        display: block; /* Make the link take full width */
-        margin-bottom: 10px; /* Space between links */
-        transition: background-color 0.3s ease; /* Smooth transition */
-    }
-.st-emotion-cache-6qob1r {
-    position: relative;
-    height: 100%;
-    width: 100%;
-    overflow: overlay;}
-    /* Styling the hover effect on the navigation links */
-    [data-testid="stSidebarNavLink"]:hover {
-        background-color: #3d3d5c; /* Slightly lighter background on hover */
-    }
+apply_theme()
 
-    /* Styling the text inside the navigation links */
-    [data-testid="stSidebarNavLink"] span {
-        font-weight: bold; /* Make the text bold */
-        font-size: 16px; /* Slightly larger font size */
-    }
+def get_vectorstore(profile):
+    embedding = CachedEmbeddings(GoogleGenerativeAIEmbeddings(model="models/embedding-001"))
+    return session_vectorstore(profile.chunks, embedding, profile_embeddings(profile, embedding))
 
-    /* Remove the default list style */
-    [data-testid="stSidebarNavItems"] {
-        list-style-type: none;
-        padding: 0;
-    }
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 12px;
-
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #2e2e3e;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background-color: #555555;
-        border-radius: 6px;
-        border: 3px solid #2e2e3e;
-    }
-    </style>
-"""
-st.markdown(page_style, unsafe_allow_html=True)
-
-def get_pdf_text(pdf):
-    text = ""
-    pdfReader = PdfReader(pdf)
-    for page in pdfReader.pages:
-        text += page.extract_text()
-    return text
-
-def get_text_chunks(text):
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=750,
-        chunk_overlap=50,
-        length_function=len
-    )
-    chunks = text_splitter.split_text(text)
-    return chunks
-
-def get_vectorstore(text_chunks):
-    dataset_path = "./my_deeplake_candidate/"
-    vectorstore = DeepLake.from_texts(text_chunks, dataset_path=dataset_path, embedding=GoogleGenerativeAIEmbeddings(model="models/embedding-001"))
-    return vectorstore
-
-def get_conversation_chain(vectorstore):
-    llm = ChatGoogleGenerativeAI(model="gemini-1.5-flash")
+def get_conversation_chain(vectorstore, use_cache=True, stream_handler=None):
+    cache = get_response_cache("course_recommender") if use_cache else False
+    # Only the answering model streams; follow-up question rewriting stays silent
+    llm = ChatGoogleGenerativeAI(model=LLM_MODEL, cache=cache, callbacks=[stream_handler] if stream_handler else None)
     memory = ConversationBufferMemory(memory_key='chat_history', return_messages=True)
     conversation_chain = ConversationalRetrievalChain.from_llm(
         llm=llm,
         memory=memory,
         retriever=vectorstore.as_retriever(),
+        condense_question_llm=ChatGoogleGenerativeAI(model=LLM_MODEL, cache=cache),
     )
     return conversation_chain
 
-def get_auth_header(client_id, client_secret):
-    auth_str = f"{client_id}:{client_secret}"
-    auth_bytes = auth_str.encode("ascii")
-    auth_base64 = base64.b64encode(auth_bytes).decode("ascii")
-    return {"Authorization": f"Basic {auth_base64}"}
-
-def fetch_udemy_courses(auth_header, query="", fields="", page_size=5):
-    base_url = "https://www.udemy.com/api-2.0/courses/"
-    params = {
-        "search": query,
-        "page": 1,
-        "page_size": page_size,
-        "fields[course]": fields
-    }
-    response = requests.get(base_url, headers=auth_header, params=params)
-    if response.status_code == 200:
-        return response.json()
+def parse_skills(missing_skills, limit=8):
+    lines = [line for line in missing_skills.splitlines() if line.strip()]
+    bullets = [line for line in lines if re.match(r"^\s*(?:\d+[.)]|[-*•])\s+", line)]
+    # The prompt asks for one skill per line; headings ending in ":" are skipped
+    lines = bullets or [line for line in lines if not line.rstrip().endswith(":")]
+    if len(lines) > 1 or bullets:
+        # "- **Docker:** containerising services" -> "Docker"
+        candidates = [re.split(r":|\s[-–]\s|\(", re.sub(r"^\s*(?:\d+[.)]|[-*•])\s+", "", line))[0] for line in lines]
     else:
-        st.error(f"Failed to fetch courses: {response.status_code}")
-        return None
+        # Fallback for a single line of prose or a comma separated list
+        candidates = re.split(r",|;|\band\b", missing_skills)
+    skills = {}
+    for candidate in candidates:
+        skill = re.sub(r"[*_`]", "", candidate).strip(" .")
+        if skill and len(skill) <= 60:
+            skills.setdefault(skill.lower(), skill)
+    return list(skills.values())[:limit]
+
+# Merge the per-skill results, drop duplicates and rank by rating, then popularity
+def rank_courses(skills, results, limit=10):
+    courses = {}
+    for skill, result in zip(skills, results):
+        if isinstance(result, Exception) or not result:
+            continue
+        for course in result.get('results', []):
+            entry = courses.setdefault(course['url'], dict(course, skills=[]))
+            entry['skills'].append(skill)
+    ranked = sorted(courses.values(), key=lambda c: (c.get('avg_rating') or 0, c.get('num_subscribers') or 0), reverse=True)
+    return ranked[:limit]
 
 def generate_courses(job_role, work_experience, resume):
-    raw_text = get_pdf_text(resume)
-    text_chunks = get_text_chunks(raw_text)
-    vectorstore = get_vectorstore(text_chunks)
-    chain = get_conversation_chain(vectorstore)
-    
-    prompt = f'''
-    You are an experienced Human Resource Manager and Courses recommender. 
-    Analyze and extract the skills from the resume of the candidate. Output only the technical skills.
-    '''
-    response1 = chain({'question': prompt})
+    try:
+        profile = load_resume_profile(resume)
+    except PdfLimitError as e:
+        st.error(str(e))
+        return
+    with get_vectorstore(profile) as vectorstore:
+        stream_handler = StreamHandler()
+        chain = get_conversation_chain(vectorstore, stream_handler=stream_handler)
+
+        # Skills only depend on the resume, so they are extracted once per file
+        skills = profile.skills.get(LLM_MODEL)
+        if skills is None:
+            prompt = f'''
+            You are an experienced Human Resource Manager and Courses recommender. 
+            Analyze and extract the skills from the resume of the candidate. Output only the technical skills.
+            '''
+            response1 = chain({'question': prompt})
+            skills = set_profile_skills(profile, LLM_MODEL, response1['answer'])
+
+        missing_skills_prompt = f'''
+        Based on the job role {job_role} and work experience {work_experience}, 
+        and the skills identified in the resume ({skills}), 
+        identify any missing technical skills.
+        List one skill per line as "- <skill name>", names only, with no explanations, headings or other text.
+        '''
+        st.subheader("Skills Gap Analysis:")
+        answer_placeholder = st.empty()
+        stream_handler.attach(answer_placeholder)
+        response2 = chain({'question': missing_skills_prompt})
+        missing_skills = response2['answer']
+        answer_placeholder.write(missing_skills)
     
-    missing_skills_prompt = f'''
-    Based on the job role {job_role} and work experience {work_experience}, 
-    and the skills identified in the resume ({response1['answer']}), 
-    identify any missing technical skills.
-    '''
-    response2 = chain({'question': missing_skills_prompt})
-    missing_skills = response2['answer']
-
-    st.subheader("Skills Gap Analysis:")
-    st.write(missing_skills)
-    
-    client_id = os.getenv("UDEMY_CLIENT_ID")
-    client_secret = os.getenv("UDEMY_CLIENT_SECRET")
+    client = get_course_client()
     fields = "title,headline,url,num_subscribers,avg_rating,price"
 
-    if client_id and client_secret:
-        auth_header = get_auth_header(client_id, client_secret)
-        courses = fetch_udemy_courses(auth_header, query=missing_skills, fields=fields)
+    if client:
+        skills = parse_skills(missing_skills)
+        # One search per skill, all in flight at once
+        results = client.search_many(skills, fields=fields, page_size=3)
+        failures = [str(result) for result in results if isinstance(result, Exception)]
+        if failures:
+            st.error("\n\n".join(failures))
+        courses = rank_courses(skills, results)
         if courses:
             st.header(f"Courses to Improve your skills:")
-            for course in courses.get('results', []):
+            for course in courses:
                 st.markdown(f"""
     <div style="
         border: 2px solid #34344a;
@@ -196,6 +129,7 @@ def generate_courses(job_role, work_experience, resume):
         <p><strong>Number of Subscribers:</strong> {course['num_subscribers']}</p>
         <p><strong>Average Rating:</strong> {course['avg_rating']}</p>
         <p><strong>Price:</strong> {course['price']}</p>
+        <p><strong>Covers:</strong> {', '.join(course['skills'])}</p>
         <a href="https://www.udemy.com{course['url']}" style="color: #ff4b4b; text-decoration: none; font-weight: bold;">
             View Course
         </a>
@@ -207,8 +141,6 @@ def generate_courses(job_role, work_experience, resume):
                 # st.write(f"**Average Rating:** {course['avg_rating']}")
                 # st.write(f"**Price:** {course['price']}")
                 # st.write(f"[View Course](https://www.udemy.com{course['url']})")
-    
-    DeepLake.force_delete_by_path("./my_deeplake_candidate")
 
 def start():
     st.title("Course Recommender")
@@ -222,6 +154,9 @@ def start():
     if submit:
         with st.spinner('Processing...'):
             generate_courses(job_role, work_experience, resume)
+        cache_stats = get_embedding_store().stats()
+        st.sidebar.caption(f"Embedding cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses")
+        st.sidebar.caption(f"Response cache hit rate: {get_response_cache('course_recommender').stats()['hit_rate']:.0%}")
 
 if __name__ == "__main__":
     start()
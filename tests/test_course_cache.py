@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from utils.course_cache import CachedUdemyClient, CourseCache
+from utils.udemy import UdemyClient
+
+
+class StandIn:
+    """Local stand-in for the Udemy search endpoint that counts requests per query."""
+
+    def __init__(self):
+        self.hits = {}
+        self.status = 200
+        self.delay = 0
+        self.version = 1
+        self._lock = threading.Lock()
+
+    def handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)["search"][0]
+                with stand_in._lock:
+                    stand_in.hits[query] = stand_in.hits.get(query, 0) + 1
+                time.sleep(stand_in.delay)
+                body = json.dumps({"results": [{"title": f"{query} v{stand_in.version}"}]}).encode()
+                self.send_response(stand_in.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stand_in():
+    stand_in = StandIn()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stand_in.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stand_in.url = f"http://127.0.0.1:{server.server_port}/courses/"
+    yield stand_in
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stand_in, tmp_path):
+    udemy = UdemyClient("id", "secret", base_url=stand_in.url, timeout=5, max_retries=0)
+    return CachedUdemyClient(udemy, CourseCache(tmp_path / "courses.sqlite"), ttl=3600)
+
+
+def _title(payload):
+    return payload["results"][0]["title"]
+
+
+def _wait_for_refreshes(client):
+    client._executor.shutdown(wait=True)
+
+
+def test_fresh_entries_are_served_locally(client, stand_in):
+    assert _title(client.search_courses("Python")) == "Python v1"
+    assert _title(client.search_courses("Python")) == "Python v1"
+    assert [_title(r) for r in client.search_many(["Python", "Go"])] == ["Python v1", "Go v1"]
+
+    assert stand_in.hits == {"Python": 1, "Go": 1}
+
+
+def test_stale_entry_is_served_then_refreshed(client, stand_in):
+    client.search_courses("Python")
+    stand_in.version = 2
+    client.ttl = -1
+
+    assert _title(client.search_courses("Python")) == "Python v1"
+    _wait_for_refreshes(client)
+
+    assert stand_in.hits == {"Python": 2}
+    assert _title(client.cache.get("Python", "", 5)[0]) == "Python v2"
+
+
+def test_failed_refresh_keeps_serving_stale(client, stand_in):
+    client.search_courses("Python")
+    stand_in.status = 500
+    client.ttl = -1
+
+    assert _title(client.search_courses("Python")) == "Python v1"
+    _wait_for_refreshes(client)
+
+    assert stand_in.hits == {"Python": 2}
+    assert _title(client.cache.get("Python", "", 5)[0]) == "Python v1"
+
+
+def test_concurrent_stale_reads_refresh_once(client, stand_in):
+    client.search_courses("Python")
+    stand_in.delay = 0.3
+    client.ttl = -1
+
+    threads = [threading.Thread(target=client.search_courses, args=("Python",)) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _wait_for_refreshes(client)
+
+    assert stand_in.hits == {"Python": 2}
@@ -0,0 +1,29 @@
+import pytest
+
+from utils.question_bank import QuestionBank
+
+
+class FakeGenerator:
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.calls = 0
+
+    def __call__(self, job_role, work_experience):
+        self.calls += 1
+        return self.batches.pop(0) if self.batches else []
+
+
+def test_cold_pool_keeps_generating_until_full(tmp_path):
+    generate = FakeGenerator(["Q1?", "Q2?", "Q3?"], ["Q3?", "Q4?", "Q5?", "Q6?"])
+    bank = QuestionBank(tmp_path / "bank.sqlite", generate=generate)
+
+    questions = bank.draw("Data Engineer", "3", k=5)
+
+    assert len(questions) == 5 and len(set(questions)) == 5
+
+
+def test_short_pool_raises(tmp_path):
+    bank = QuestionBank(tmp_path / "bank.sqlite", generate=FakeGenerator(["Q1?", "Q2?"]))
+
+    with pytest.raises(ValueError, match="Only 2 of 5"):
+        bank.draw("Data Engineer", "3", k=5)
@@ -0,0 +1,43 @@
+import csv
+import io
+import zipfile
+
+from utils import resume_batch
+
+RECORD = {
+    "name": "R&D <Lead", "email": "hr@example.com", "phone": "555", "address": "1 Main St",
+    "education": "BSc & MSc", "experience": "<b>Lead", "skills": "C++", "hobbies": "Chess",
+    "languages": "English", "leetcode_username": "lc", "github_username": "gh",
+}
+
+
+def _timings(path):
+    with zipfile.ZipFile(path) as archive:
+        return list(csv.DictReader(io.StringIO(archive.read("timings.csv").decode("utf-8"))))
+
+
+def test_markup_characters_render(tmp_path):
+    summary = resume_batch.run_batch([RECORD], tmp_path / "out.zip", workers=1, stub=True)
+
+    assert summary["rendered"] == 1
+    assert [row["status"] for row in _timings(tmp_path / "out.zip")] == ["ok"]
+
+
+def test_failed_record_does_not_abort_batch(tmp_path, monkeypatch):
+    render = resume_batch.create_resume_pdf
+
+    def flaky(name, *args):
+        if name == "Broken":
+            raise ValueError("paraparser: syntax error")
+        return render(name, *args)
+
+    monkeypatch.setattr(resume_batch, "create_resume_pdf", flaky)
+    records = [dict(RECORD, name="Broken"), dict(RECORD, name="Fine")]
+    summary = resume_batch.run_batch(records, tmp_path / "out.zip", workers=1, stub=True)
+
+    assert summary["rendered"] == 1 and summary["failed"] == 1
+    rows = _timings(tmp_path / "out.zip")
+    assert rows[0]["status"] == "failed: ValueError: paraparser: syntax error"
+    assert rows[1]["status"] == "ok"
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert sorted(archive.namelist()) == ["00002-fine.pdf", "timings.csv"]
@@ -0,0 +1,43 @@
+from langchain_core.language_models import FakeListChatModel
+
+from utils.streaming import STREAMING_MARKER, StreamHandler
+
+
+class Placeholder:
+    def __init__(self):
+        self.renders = []
+
+    def markdown(self, text):
+        self.renders.append(text)
+
+
+def test_streaming_marker_available():
+    # The pinned langchain-core still exposes the private marker StreamHandler relies on
+    assert STREAMING_MARKER
+
+
+def test_invoke_streams_each_chunk_once():
+    placeholder = Placeholder()
+    handler = StreamHandler(placeholder)
+    model = FakeListChatModel(responses=["Hello streaming world"], callbacks=[handler])
+
+    answer = model.invoke("hi").content
+
+    assert answer == "Hello streaming world"
+    assert "".join(handler.tokens) == answer
+    assert len(handler.tokens) == len(answer)
+    assert placeholder.renders[0] == "H▌"
+    assert placeholder.renders[-1] == answer + "▌"
+
+
+def test_detached_handler_drops_tokens():
+    handler = StreamHandler()
+    model = FakeListChatModel(responses=["quiet"], callbacks=[handler])
+
+    assert model.invoke("hi").content == "quiet"
+    assert handler.tokens == []
+
+    placeholder = Placeholder()
+    handler.attach(placeholder)
+    model.invoke("again")
+    assert "".join(handler.tokens) == "quiet"
@@ -0,0 +1,88 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from utils import vector_index
+from utils.vector_index import session_vectorstore
+
+
+class HashEmbeddings(Embeddings):
+    """Deterministic, thread-safe bag-of-words embeddings with a fixed per-call latency."""
+
+    def __init__(self, size=4096, latency=0.0):
+        self.size = size
+        self.latency = latency
+
+    def _embed(self, text):
+        vector = np.zeros(self.size, dtype=np.float32)
+        for word in text.lower().split():
+            vector[int(hashlib.sha256(word.encode()).hexdigest(), 16) % self.size] += 1.0
+        return vector.tolist()
+
+    def embed_documents(self, texts):
+        time.sleep(self.latency)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        time.sleep(self.latency)
+        return self._embed(text)
+
+
+def _chunks(user):
+    return [f"user{user} knows skill{user}a", f"user{user} worked at company{user}", f"user{user} studied school{user}"]
+
+
+def _ask(user, embedding):
+    with session_vectorstore(_chunks(user), embedding) as store:
+        return [doc.page_content for doc in store.similarity_search(f"company{user}", k=1)]
+
+
+@pytest.mark.parametrize("n", [1, 8, 32])
+def test_concurrent_sessions_get_independent_answers(n):
+    embedding = HashEmbeddings()
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        answers = list(executor.map(lambda user: _ask(user, embedding), range(n)))
+    assert answers == [[f"user{user} worked at company{user}"] for user in range(n)]
+
+
+def test_throughput_grows_with_concurrent_sessions():
+    # Embedding calls dominate a real request; sessions must overlap them rather than serialise
+    embedding = HashEmbeddings(latency=0.05)
+
+    def run(n):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            list(executor.map(lambda user: _ask(user, embedding), range(n)))
+        return n / (time.perf_counter() - start)
+
+    single = run(1)
+    assert run(8) > 3 * single
+
+
+def test_deeplake_directory_removed_after_error(monkeypatch, tmp_path):
+    created = []
+
+    def fake_build(text_chunks, embedding, dataset_path=None, vectors=None):
+        Path(dataset_path).mkdir(parents=True)
+        (Path(dataset_path) / "dataset_meta.json").write_text("{}")
+        created.append(Path(dataset_path))
+        return object()
+
+    monkeypatch.setattr(vector_index, "VECTOR_STORE_BACKEND", "deeplake")
+    monkeypatch.setattr(vector_index, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(vector_index, "build_vectorstore", fake_build)
+
+    with pytest.raises(RuntimeError):
+        with session_vectorstore(_chunks(1), HashEmbeddings()):
+            raise RuntimeError("request failed")
+    with session_vectorstore(_chunks(2), HashEmbeddings()):
+        pass
+
+    assert len(created) == 2 and created[0] != created[1]
+    assert not any(path.exists() for path in created)
+    assert list((tmp_path / "deeplake").iterdir()) == []
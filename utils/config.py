@@ -0,0 +1,40 @@
+import os
+import tempfile
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Settings below are read at import time, before the pages call load_dotenv themselves
+load_dotenv()
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.getenv("COMPLAN_CACHE_DIR", ROOT_DIR / ".cache"))
+
+
+# Path inside the local cache directory, creating parent folders on first use
+def cache_path(*parts):
+    path = CACHE_DIR.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Writes through a uniquely named temp file beside target, so concurrent writers never share one
+def atomic_write(target, write):
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=f"{target.name}.", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def env_float(name, default):
+    value = os.getenv(name)
+    return float(value) if value else default
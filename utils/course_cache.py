@@ -0,0 +1,134 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from utils.config import cache_path, env_int
+from utils.course_catalog import get_course_catalog
+from utils.udemy import get_udemy_client
+
+# Catalog data changes slowly: entries are fresh for a day, then served stale while they refresh
+COURSE_CACHE_TTL = env_int("COURSE_CACHE_TTL", 24 * 3600)
+# live: Udemy API behind the cache; catalog: local snapshot only; auto: the snapshot once one is built
+COURSE_SOURCE = os.getenv("COURSE_SOURCE", "auto")
+
+
+class CourseCache:
+    """SQLite table of course search responses keyed by (query, fields, page_size)."""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS courses ("
+            "query TEXT NOT NULL, fields TEXT NOT NULL, page_size INTEGER NOT NULL, "
+            "payload TEXT NOT NULL, fetched REAL NOT NULL, PRIMARY KEY (query, fields, page_size))"
+        )
+        self._conn.commit()
+
+    def get(self, query, fields, page_size):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched FROM courses WHERE query = ? AND fields = ? AND page_size = ?",
+                (query, fields, page_size),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def put(self, query, fields, page_size, payload):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO courses (query, fields, page_size, payload, fetched) VALUES (?, ?, ?, ?, ?)",
+                (query, fields, page_size, json.dumps(payload), time.time()),
+            )
+            self._conn.commit()
+
+
+class CachedUdemyClient:
+    """Stale-while-revalidate front for UdemyClient with the same search methods.
+
+    Fresh entries are local reads. Stale entries are returned at once and refreshed in the
+    background; if the refresh fails the stale copy simply stays in place. Only queries that
+    were never cached reach the API in the foreground.
+    """
+
+    def __init__(self, client, cache, ttl=COURSE_CACHE_TTL):
+        self.client = client
+        self.cache = cache
+        self.ttl = ttl
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="course-refresh")
+
+    def _refresh(self, query, fields, page_size):
+        key = (query, fields, page_size)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.cache.put(query, fields, page_size, self.client.search_courses(query, fields, page_size))
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(run)
+
+    def _cached(self, query, fields, page_size):
+        entry = self.cache.get(query, fields, page_size)
+        if entry is None:
+            return None
+        payload, age = entry
+        if age > self.ttl:
+            self._refresh(query, fields, page_size)
+        return payload
+
+    def search_courses(self, query="", fields="", page_size=5):
+        payload = self._cached(query, fields, page_size)
+        if payload is None:
+            payload = self.client.search_courses(query, fields, page_size)
+            self.cache.put(query, fields, page_size, payload)
+        return payload
+
+    def search_many(self, queries, fields="", page_size=5):
+        results = [self._cached(query, fields, page_size) for query in queries]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fetched = self.refresh_many([queries[i] for i in missing], fields, page_size)
+            for i, result in zip(missing, fetched):
+                results[i] = result
+        return results
+
+    def refresh_many(self, queries, fields="", page_size=5):
+        # Always asks the API, fresh or not; failures leave the cached copy untouched
+        results = self.client.search_many(queries, fields, page_size)
+        for query, result in zip(queries, results):
+            if not isinstance(result, Exception):
+                self.cache.put(query, fields, page_size, result)
+        return results
+
+
+@lru_cache(maxsize=None)
+def _live_course_client():
+    client = get_udemy_client()
+    if client is None:
+        return None
+    return CachedUdemyClient(client, CourseCache(cache_path("courses.sqlite")))
+
+
+# Course search for the pages, or None when there is neither a catalog nor Udemy credentials.
+# In auto mode the catalog is checked on every call, so building one switches over without a restart.
+def get_course_client():
+    catalog = get_course_catalog()
+    if COURSE_SOURCE == "catalog" or (COURSE_SOURCE == "auto" and catalog.exists()):
+        return catalog
+    return _live_course_client()
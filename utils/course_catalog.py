@@ -0,0 +1,224 @@
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from utils.config import atomic_write, cache_path
+
+COURSE_CATALOG_PATH = Path(os.getenv("COURSE_CATALOG_PATH") or cache_path("course_catalog.json"))
+COURSE_FIELDS = ("id", "title", "headline", "url", "num_subscribers", "avg_rating", "price")
+# Title words count twice as much as headline words
+TITLE_WEIGHT = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[+#]+|\.[a-z0-9]+)*")
+
+
+def tokenize(text):
+    # Keeps tech names such as c++, c#, node.js and vue.js as single terms
+    return _TOKEN.findall(text.lower())
+
+
+def normalize_course(record):
+    course = {field: record.get(field) for field in COURSE_FIELDS}
+    url = str(course["url"] or "")
+    # The pages prefix https://www.udemy.com themselves, as for live API results
+    course["url"] = re.sub(r"^https?://(www\.)?udemy\.com", "", url)
+    course["id"] = course["id"] or course["url"]
+    course["title"] = str(course["title"] or "")
+    course["headline"] = str(course["headline"] or "")
+    course["num_subscribers"] = int(float(course["num_subscribers"] or 0))
+    course["avg_rating"] = float(course["avg_rating"] or 0)
+    course["price"] = str(course["price"] or "")
+    return course
+
+
+def read_snapshot(path):
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            records = list(csv.DictReader(f))
+        else:
+            data = json.load(f)
+            # Accepts a plain list, a saved API response or a saved catalog
+            records = data if isinstance(data, list) else data.get("results") or data.get("courses") or []
+    return [normalize_course(record) for record in records if record.get("title")]
+
+
+class CourseIndex:
+    """In-memory BM25 inverted index over course titles and headlines.
+
+    BM25 weights are precomputed per posting, so a lookup is a few array additions and a partial
+    sort over the matching documents.
+    """
+
+    def __init__(self, courses):
+        self.courses = courses
+        docs = [
+            Counter(tokenize(course["title"]) * TITLE_WEIGHT + tokenize(course["headline"]))
+            for course in courses
+        ]
+        lengths = np.array([sum(doc.values()) for doc in docs], dtype=np.float32)
+        avg_length = float(lengths.mean()) if len(docs) else 0.0
+
+        postings = {}
+        for doc_id, doc in enumerate(docs):
+            for term, tf in doc.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        self.postings = {}
+        for term, entries in postings.items():
+            ids = np.array([doc_id for doc_id, _ in entries], dtype=np.int32)
+            tf = np.array([tf for _, tf in entries], dtype=np.float32)
+            idf = math.log(1 + (len(docs) - len(entries) + 0.5) / (len(entries) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[ids] / avg_length)
+            self.postings[term] = (ids, (idf * tf * (BM25_K1 + 1) / (tf + norm)).astype(np.float32))
+
+        # Ties on relevance go to the better rated, more popular course
+        self.prior = np.array(
+            [course["avg_rating"] * 1e-3 + math.log1p(course["num_subscribers"]) * 1e-6 for course in courses],
+            dtype=np.float32,
+        )
+
+    def search(self, query, k=5):
+        terms = [term for term in set(tokenize(query)) if term in self.postings]
+        if not terms:
+            return []
+        scores = np.zeros(len(self.courses), dtype=np.float32)
+        for term in terms:
+            ids, weights = self.postings[term]
+            scores[ids] += weights
+        ids = np.flatnonzero(scores)
+        ranked = scores[ids] + self.prior[ids]
+        if len(ids) > k:
+            top = np.argpartition(-ranked, k)[:k]
+            ids, ranked = ids[top], ranked[top]
+        return [self.courses[i] for i in ids[np.argsort(-ranked, kind="stable")].tolist()]
+
+
+class CourseCatalog:
+    """Local course snapshot served with the same search methods as the Udemy clients.
+
+    The snapshot lives in one JSON file; the index is rebuilt whenever the file changes, so a
+    refresh from the command line is picked up by a running app on its next lookup.
+    """
+
+    def __init__(self, path=COURSE_CATALOG_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._index = None
+        self._mtime = None
+
+    def exists(self):
+        return self.path.exists()
+
+    def index(self):
+        mtime = self.path.stat().st_mtime_ns if self.path.exists() else None
+        with self._lock:
+            if self._index is None or mtime != self._mtime:
+                self._index = CourseIndex(self.load() if mtime else [])
+                self._mtime = mtime
+            return self._index
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)["courses"]
+
+    def save(self, courses):
+        payload = json.dumps({"updated": time.time(), "courses": courses})
+        atomic_write(self.path, lambda tmp: tmp.write_text(payload, encoding="utf-8"))
+
+    def merge(self, courses, replace=False):
+        # Courses are keyed by URL; newer records win
+        merged = {} if replace or not self.exists() else {course["url"]: course for course in self.load()}
+        merged.update((course["url"], course) for course in courses)
+        self.save(list(merged.values()))
+        return len(merged)
+
+    def search_courses(self, query="", fields="", page_size=5):
+        courses = self.index().search(query, page_size)
+        if fields:
+            wanted = fields.split(",")
+            courses = [{field: course.get(field) for field in wanted} for course in courses]
+        return {"count": len(courses), "next": None, "previous": None, "results": courses}
+
+    def search_many(self, queries, fields="", page_size=5):
+        return [self.search_courses(query, fields, page_size) for query in queries]
+
+
+@lru_cache(maxsize=None)
+def get_course_catalog():
+    return CourseCatalog()
+
+
+def refresh_catalog(catalog, client, queries, page_size=50):
+    fields = ",".join(COURSE_FIELDS)
+    courses, failures = [], []
+    for query, result in zip(queries, client.search_many(queries, fields=fields, page_size=page_size)):
+        if isinstance(result, Exception):
+            failures.append(f"{query}: {result}")
+        else:
+            courses.extend(normalize_course(course) for course in result.get("results", []))
+    return catalog.merge(courses), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the local course catalog.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Load courses from JSON or CSV snapshots")
+    ingest.add_argument("files", nargs="+")
+    ingest.add_argument("--replace", action="store_true", help="Drop the existing catalog first")
+
+    refresh = commands.add_parser("refresh", help="Pull courses from the live Udemy API")
+    refresh.add_argument("queries", nargs="*", help="Search terms (default: every roadmap tech)")
+    refresh.add_argument("--queries-file", help="File with one search term per line")
+    refresh.add_argument("--page-size", type=int, default=50)
+
+    search = commands.add_parser("search", help="Query the catalog and time the lookup")
+    search.add_argument("query")
+    search.add_argument("--page-size", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = get_course_catalog()
+    if args.command == "ingest":
+        courses = [course for path in args.files for course in read_snapshot(path)]
+        print(f"{catalog.merge(courses, replace=args.replace)} courses in {catalog.path}")
+    elif args.command == "refresh":
+        from utils.course_warmer import ROADMAP
+        from utils.udemy import get_udemy_client
+
+        client = get_udemy_client()
+        if client is None:
+            parser.error("UDEMY_CLIENT_ID and UDEMY_CLIENT_SECRET must be set to refresh")
+        queries = list(args.queries)
+        if args.queries_file:
+            with open(args.queries_file, encoding="utf-8") as f:
+                queries.extend(line.strip() for line in f if line.strip())
+        queries = queries or [tech for techs in ROADMAP.values() for tech in techs]
+        total, failures = refresh_catalog(catalog, client, queries, args.page_size)
+        for failure in failures:
+            print(failure)
+        print(f"{total} courses in {catalog.path}")
+    else:
+        catalog.index()
+        start = time.perf_counter()
+        results = catalog.search_courses(args.query, page_size=args.page_size)["results"]
+        elapsed = time.perf_counter() - start
+        for course in results:
+            print(f"{course['avg_rating']:.1f}  {course['title']}  ({course['url']})")
+        print(f"{len(results)} results in {elapsed * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
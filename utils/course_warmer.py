@@ -0,0 +1,54 @@
+import threading
+import time
+from functools import lru_cache
+
+from utils.config import env_int
+from utils.course_cache import COURSE_CACHE_TTL, CachedUdemyClient, get_course_client
+
+ROADMAP = {
+    "Frontend": ["HTML", "CSS", "JavaScript", "React", "Vue.js", "Angular"],
+    "Backend": ["Node.js", "Express", "Django", "Flask", "Ruby on Rails"],
+    "DevOps": ["Docker", "Kubernetes", "CI/CD", "AWS", "Azure", "GCP"],
+    "Databases": ["MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite"],
+    "Others": ["Python", "Java", "C++", "TypeScript", "Git"]
+}
+ROADMAP_FIELDS = "title,headline,url,num_subscribers,avg_rating,price"
+ROADMAP_PAGE_SIZE = 1
+# Re-warm well inside the cache TTL so roadmap lookups never see a stale entry or wait on the API
+COURSE_WARM_INTERVAL = env_int("COURSE_WARM_INTERVAL", COURSE_CACHE_TTL // 2)
+
+
+def roadmap_courses(techs):
+    client = get_course_client()
+    if client is None:
+        return [None] * len(techs)
+    return client.search_many(techs, fields=ROADMAP_FIELDS, page_size=ROADMAP_PAGE_SIZE)
+
+
+def warm_roadmap_courses():
+    # Re-fetches every tech even while its cache entry is fresh, so roadmap data is never older than the interval
+    client = get_course_client()
+    if not isinstance(client, CachedUdemyClient):
+        return None
+    techs = [tech for techs in ROADMAP.values() for tech in techs]
+    return client.refresh_many(techs, fields=ROADMAP_FIELDS, page_size=ROADMAP_PAGE_SIZE)
+
+
+def _warm_forever():
+    while True:
+        try:
+            warm_roadmap_courses()
+        except Exception:
+            pass
+        time.sleep(COURSE_WARM_INTERVAL)
+
+
+# Started once per server process; later calls are no-ops
+@lru_cache(maxsize=None)
+def start_course_warmer():
+    # Only the live API needs warming; the local catalog answers in-process
+    if not isinstance(get_course_client(), CachedUdemyClient):
+        return None
+    thread = threading.Thread(target=_warm_forever, name="course-warmer", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,134 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from utils.config import cache_path, env_int
+
+# Upper bound for the stored vectors; least recently used rows are evicted past it
+EMBEDDING_CACHE_MAX_BYTES = env_int("EMBEDDING_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+
+
+def embedding_model_name(embedding):
+    model = getattr(embedding, "model", None) or getattr(embedding, "model_name", None)
+    return f"{type(embedding).__name__}:{model}"
+
+
+class EmbeddingStore:
+    """SQLite table of float32 vectors keyed by (embedding model, sha256 of the text)."""
+
+    def __init__(self, path, max_bytes=EMBEDDING_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "last_used REAL NOT NULL, PRIMARY KEY (model, text_hash))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def text_hash(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, model, hashes):
+        found = {}
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                batch = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch],
+                ).fetchall()
+                found.update((text_hash, np.frombuffer(vector, dtype=np.float32)) for text_hash, vector in rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(time.time(), model, text_hash) for text_hash in found],
+                )
+                self._conn.commit()
+            self.hits += sum(1 for text_hash in hashes if text_hash in found)
+            self.misses += sum(1 for text_hash in hashes if text_hash not in found)
+        return found
+
+    def put_many(self, model, items):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(model, text_hash, np.asarray(vector, dtype=np.float32).tobytes(), now) for text_hash, vector in items],
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY last_used").fetchall()
+        stale = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((rowid,))
+            total -= size
+        self._conn.executemany("DELETE FROM embeddings WHERE rowid = ?", stale)
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+
+@lru_cache(maxsize=None)
+def get_embedding_store():
+    return EmbeddingStore(cache_path("embeddings.sqlite"))
+
+
+class CachedEmbeddings(Embeddings):
+    """Wraps any LangChain embedding so only texts missing from the store reach the provider."""
+
+    def __init__(self, embedding, store=None):
+        self.embedding = embedding
+        self.store = store or get_embedding_store()
+        self.model = embedding_model_name(embedding)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [self.store.text_hash(text) for text in texts]
+        found = self.store.get_many(self.model, list(dict.fromkeys(hashes)))
+
+        missing = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in found:
+                missing.setdefault(text_hash, text)
+        if missing:
+            vectors = self.embedding.embed_documents(list(missing.values()))
+            computed = list(zip(missing.keys(), vectors))
+            self.store.put_many(self.model, computed)
+            found.update((text_hash, np.asarray(vector, dtype=np.float32)) for text_hash, vector in computed)
+
+        return [found[text_hash].tolist() for text_hash in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        # Queries are namespaced apart from documents since some providers embed them differently
+        model = f"{self.model}:query"
+        text_hash = self.store.text_hash(text)
+        found = self.store.get_many(model, [text_hash])
+        if text_hash in found:
+            return found[text_hash].tolist()
+        vector = self.embedding.embed_query(text)
+        self.store.put_many(model, [(text_hash, vector)])
+        return list(vector)
@@ -0,0 +1,210 @@
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.config import ROOT_DIR, atomic_write, cache_path
+
+MARKET_DATA_PATH = Path(os.getenv("MARKET_DATA_PATH") or ROOT_DIR / "ai_job_market_insights.csv")
+# Keep a typed Parquet copy of the dataset next to the aggregates for fast reloads
+MARKET_COLUMNAR_COPY = os.getenv("MARKET_COLUMNAR_COPY", "1") == "1"
+
+# Every text column has a handful of distinct values, so categoricals store them as small integer codes
+CATEGORY_COLUMNS = [
+    "Job_Title", "Industry", "Company_Size", "Location", "AI_Adoption_Level",
+    "Automation_Risk", "Required_Skills", "Remote_Friendly", "Job_Growth_Projection",
+]
+MARKET_DTYPES = {**{column: "category" for column in CATEGORY_COLUMNS}, "Salary_USD": "float32"}
+
+
+def read_market_data(path=MARKET_DATA_PATH):
+    # Multithreaded pyarrow parser, with categoricals and float32 applied as the columns are built
+    return pd.read_csv(path, engine="pyarrow", dtype=MARKET_DTYPES)
+
+
+def load_market_data(path=MARKET_DATA_PATH, version=None):
+    if not MARKET_COLUMNAR_COPY:
+        return read_market_data(path)
+    version = version or dataset_version(path)
+    target = cache_path("market", version[:16], "data.parquet")
+    if target.exists():
+        return pd.read_parquet(target)
+    data = read_market_data(path)
+    atomic_write(target, lambda tmp: data.to_parquet(tmp, index=False))
+    return data
+
+
+
+# Sidebar filters; every cube keeps these as its leading dimensions
+FILTER_DIMENSIONS = ["Location", "Company_Size", "Remote_Friendly", "Industry", "AI_Adoption_Level"]
+# One cube per chart dimension that is not already a filter: (filters + dimension) -> Count, Salary_Sum
+CUBES = {
+    "job_title": ["Job_Title"],
+    "skills": ["Required_Skills"],
+    "growth": ["Job_Growth_Projection"],
+}
+
+
+def build_cube(data, dimensions):
+    # Salaries load as float32; sum them in float64 so cells over millions of rows stay exact
+    salary = data["Salary_USD"].astype("float64")
+    grouped = salary.groupby([data[dimension] for dimension in FILTER_DIMENSIONS + dimensions], observed=True)
+    return grouped.agg(Count="size", Salary_Sum="sum").reset_index()
+
+
+def slice_cube(cube, filters):
+    # filters maps a dimension to its selected values; a missing or empty selection keeps everything
+    mask = np.ones(len(cube), dtype=bool)
+    for dimension, values in filters.items():
+        if values:
+            mask &= cube[dimension].isin(values).to_numpy()
+    return cube[mask]
+
+
+def _rollup(cells, dimensions):
+    return cells.groupby(dimensions, observed=True)[["Count", "Salary_Sum"]].sum().reset_index()
+
+
+def average_salary(cubes, filters):
+    table = _rollup(slice_cube(cubes["job_title"], filters), ["Job_Title"])
+    table["Salary_USD"] = table["Salary_Sum"] / table["Count"]
+    return table[["Job_Title", "Salary_USD"]].sort_values(by="Salary_USD", ascending=False)
+
+
+def skills_count(cubes, filters):
+    table = _rollup(slice_cube(cubes["skills"], filters), ["Required_Skills"])
+    return table[["Required_Skills", "Count"]].sort_values(by="Count", ascending=False)
+
+
+def industry_count(cubes, filters):
+    table = _rollup(slice_cube(cubes["growth"], filters), ["Industry"])
+    return table[["Industry", "Count"]].sort_values(by="Count", ascending=False)
+
+
+def adoption_skills_count(cubes, filters):
+    table = _rollup(slice_cube(cubes["skills"], filters), ["Required_Skills", "AI_Adoption_Level"])
+    return table[["Required_Skills", "AI_Adoption_Level", "Count"]]
+
+
+def industry_growth(cubes, filters):
+    table = _rollup(slice_cube(cubes["growth"], filters), ["Industry", "Job_Growth_Projection"])
+    return table[["Industry", "Job_Growth_Projection", "Count"]]
+
+
+# Every table the Job Market Insights page draws, by name
+CHARTS = {
+    "average_salary": average_salary,
+    "skills_count": skills_count,
+    "industry_count": industry_count,
+    "adoption_skills_count": adoption_skills_count,
+    "industry_growth": industry_growth,
+}
+
+
+def chart_tables(cubes, filters):
+    return {name: build(cubes, filters) for name, build in CHARTS.items()}
+
+
+def filter_options(cubes):
+    cube = cubes["growth"]
+    return {dimension: list(cube[dimension].cat.categories) for dimension in FILTER_DIMENSIONS}
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def dataset_version(path=MARKET_DATA_PATH):
+    # Content hash of the dataset; the file is only re-read when its size or mtime changes
+    path = Path(path)
+    stat = path.stat()
+    manifest_path = cache_path("market", "manifest.json")
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    entry = manifest.get(str(path.resolve()))
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["sha256"]
+    sha = _file_digest(path)
+    manifest[str(path.resolve())] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+    atomic_write(manifest_path, lambda tmp: tmp.write_text(json.dumps(manifest)))
+    return sha
+
+
+def materialize(path, version):
+    data = load_market_data(path, version)
+    cubes = {}
+    for name, dimensions in CUBES.items():
+        cube = build_cube(data, dimensions)
+        target = cache_path("market", version[:16], f"{name}.cube.parquet")
+        atomic_write(target, lambda tmp: cube.to_parquet(tmp, index=False))
+        cubes[name] = cube
+    return cubes
+
+
+def load_cubes(path=MARKET_DATA_PATH, version=None):
+    # Reads the pre-aggregated cubes for this dataset version, building them on first use
+    version = version or dataset_version(path)
+    targets = {name: cache_path("market", version[:16], f"{name}.cube.parquet") for name in CUBES}
+    if not all(target.exists() for target in targets.values()):
+        return materialize(path, version)
+    return {name: pd.read_parquet(target) for name, target in targets.items()}
+
+
+def write_synthetic_dataset(target, rows, source=MARKET_DATA_PATH, chunk=500_000, seed=0):
+    # Samples every column independently from the real dataset, so cardinalities match production
+    sample = pd.read_csv(source)
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk):
+        size = min(chunk, rows - start)
+        frame = pd.DataFrame({
+            column: rng.choice(sample[column].to_numpy(), size)
+            if column in CATEGORY_COLUMNS else rng.normal(sample[column].mean(), sample[column].std(), size)
+            for column in sample.columns
+        })
+        frame.to_csv(target, mode="w" if start == 0 else "a", header=start == 0, index=False)
+
+
+def _measure(label, load):
+    start = time.perf_counter()
+    data = load()
+    elapsed = time.perf_counter() - start
+    memory = data.memory_usage(deep=True).sum() / 2 ** 20
+    print(f"{label:<28} {elapsed:8.2f} s {memory:10.1f} MiB")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CSV ingest paths for the job market dataset.")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Rows in the synthetic dataset")
+    parser.add_argument("--csv", help="Benchmark an existing CSV instead of generating one")
+    parser.add_argument("--skip-baseline", action="store_true", help="Skip the untyped read_csv run")
+    args = parser.parse_args()
+
+    path = Path(args.csv) if args.csv else cache_path("market", f"synthetic_{args.rows}.csv")
+    if not path.exists():
+        print(f"Writing {args.rows:,} rows to {path}")
+        write_synthetic_dataset(path, args.rows)
+    print(f"{path} ({path.stat().st_size / 2 ** 20:.1f} MiB)")
+
+    if not args.skip_baseline:
+        data = _measure("read_csv (object dtypes)", lambda: pd.read_csv(path))
+        del data
+    data = _measure("read_market_data (typed)", lambda: read_market_data(path))
+    with tempfile.TemporaryDirectory() as folder:
+        data.to_parquet(Path(folder, "data.parquet"), index=False)
+        data.reset_index(drop=True).to_feather(Path(folder, "data.feather"))
+        _measure("parquet copy", lambda: pd.read_parquet(Path(folder, "data.parquet")))
+        _measure("feather copy", lambda: pd.read_feather(Path(folder, "data.feather")))
+
+
+if __name__ == "__main__":
+    main()
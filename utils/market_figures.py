@@ -0,0 +1,116 @@
+import pandas as pd
+import plotly.express as px
+
+from utils.config import env_int
+
+# Categorical axes beyond this many values keep the largest and fold the rest into "Other"
+FIGURE_MAX_CATEGORIES = env_int("FIGURE_MAX_CATEGORIES", 50)
+# Line charts switch to WebGL above this many points
+FIGURE_WEBGL_POINTS = env_int("FIGURE_WEBGL_POINTS", 1000)
+
+
+def limit_categories(table, dimension, value, limit=FIGURE_MAX_CATEGORIES, sum_value=True):
+    # Keeps the payload bounded however many distinct values the dataset grows
+    totals = table.groupby(dimension, observed=True)[value].sum()
+    if len(totals) <= limit:
+        return table
+    keep = set(totals.nlargest(limit - 1).index)
+    table = table.copy()
+    table[dimension] = table[dimension].astype(str).where(table[dimension].isin(keep), "Other")
+    if not sum_value:
+        return table[table[dimension] != "Other"]
+    others = [column for column in table.columns if column != value]
+    return table.groupby(others, sort=False)[value].sum().reset_index()
+
+
+def _render_mode(table):
+    return "webgl" if len(table) > FIGURE_WEBGL_POINTS else "auto"
+
+
+def average_salary_figure(table):
+    # Averages cannot be summed, so extra job titles are dropped rather than folded into "Other"
+    table = limit_categories(table, "Job_Title", "Salary_USD", sum_value=False)
+    fig = px.bar(
+        table,
+        x='Job_Title',
+        y='Salary_USD',
+        title="Average Salary per Job Title",
+        labels={'Salary_USD': 'Average Salary (USD)', 'Job_Title': 'Job Title'},
+        text='Salary_USD'
+    )
+    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    return fig
+
+
+def skills_figure(table):
+    table = limit_categories(table, "Required_Skills", "Count")
+    return px.pie(
+        table,
+        values='Count',
+        names='Required_Skills',
+        title="Required Skills for the Jobs",
+        hole=0.4
+    )
+
+
+def industry_figure(table):
+    table = limit_categories(table, "Industry", "Count")
+    fig = px.line(
+        table,
+        x='Industry',
+        y='Count',
+        title="Job Count by Industry",
+        labels={'Count': 'Job Count', 'Industry': 'Industry'},
+        render_mode=_render_mode(table)
+    )
+    fig.update_traces(mode='lines+markers')
+    return fig
+
+
+def adoption_skills_figure(table):
+    table = limit_categories(table, "Required_Skills", "Count")
+    fig = px.line(
+        table,
+        x='Required_Skills',
+        y='Count',
+        color='AI_Adoption_Level',
+        title="Required Skills vs AI Adoption Count",
+        labels={'Count': 'AI Adoption Count', 'Required_Skills': 'Required Skills'},
+        render_mode=_render_mode(table)
+    )
+    fig.update_traces(mode='lines+markers')
+    return fig
+
+
+def growth_figure(table):
+    table = limit_categories(table, "Industry", "Count")
+    return px.bar(
+        table,
+        x='Industry',
+        y='Count',
+        color='Job_Growth_Projection',
+        title="Industry Job Growths",
+        labels={'Count': 'Job Count'},
+        barmode='stack'
+    )
+
+
+FIGURES = {
+    "average_salary": average_salary_figure,
+    "skills_count": skills_figure,
+    "industry_count": industry_figure,
+    "adoption_skills_count": adoption_skills_figure,
+    "industry_growth": growth_figure,
+}
+
+
+def figures_json(tables):
+    # Serialized once per dataset version and filter state; empty when nothing matches the filters
+    if tables["industry_count"].empty:
+        return {}
+    return {name: build(_plain(tables[name])).to_json() for name, build in FIGURES.items()}
+
+
+def _plain(table):
+    # Categorical columns would carry every unused category into the figure
+    return table.astype({column: str for column in table.columns if isinstance(table[column].dtype, pd.CategoricalDtype)})
@@ -0,0 +1,78 @@
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from utils.config import env_int
+
+# "pypdf2" is always available; "pymupdf" is faster but needs the optional PyMuPDF package
+PDF_TEXT_BACKEND = os.getenv("PDF_TEXT_BACKEND", "pypdf2")
+PDF_MAX_BYTES = env_int("PDF_MAX_BYTES", 10 * 1024 * 1024)
+PDF_MAX_PAGES = env_int("PDF_MAX_PAGES", 50)
+# Smaller documents are extracted inline, where process start-up would cost more than it saves
+PDF_PARALLEL_MIN_PAGES = env_int("PDF_PARALLEL_MIN_PAGES", 16)
+PDF_WORKERS = env_int("PDF_WORKERS", min(4, os.cpu_count() or 1))
+
+
+class PdfLimitError(ValueError):
+    pass
+
+
+def read_pdf_bytes(pdf):
+    if isinstance(pdf, (bytes, bytearray)):
+        return bytes(pdf)
+    if isinstance(pdf, (str, os.PathLike)):
+        with open(pdf, "rb") as f:
+            return f.read(PDF_MAX_BYTES + 1)
+    if hasattr(pdf, "getvalue"):
+        return pdf.getvalue()
+    pdf.seek(0)
+    return pdf.read(PDF_MAX_BYTES + 1)
+
+
+def _page_count(data, backend):
+    if backend == "pymupdf":
+        import fitz
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return doc.page_count
+    from PyPDF2 import PdfReader
+    return len(PdfReader(io.BytesIO(data)).pages)
+
+
+# Runs in worker processes, so it takes plain bytes and a page range rather than a reader
+def _extract_range(data, start, stop, backend):
+    if backend == "pymupdf":
+        import fitz
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return [doc[i].get_text() for i in range(start, stop)]
+    from PyPDF2 import PdfReader
+    reader = PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+@lru_cache(maxsize=None)
+def _get_pool():
+    # spawn avoids forking the threaded Streamlit server
+    return ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+def get_pdf_text(pdf, backend=None):
+    backend = backend or PDF_TEXT_BACKEND
+    data = read_pdf_bytes(pdf)
+    if len(data) > PDF_MAX_BYTES:
+        raise PdfLimitError(f"PDF is larger than {PDF_MAX_BYTES // (1024 * 1024)} MB.")
+
+    num_pages = _page_count(data, backend)
+    if num_pages > PDF_MAX_PAGES:
+        raise PdfLimitError(f"PDF has {num_pages} pages; the limit is {PDF_MAX_PAGES}.")
+
+    if num_pages < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS < 2:
+        return "".join(_extract_range(data, 0, num_pages, backend))
+
+    step = -(-num_pages // PDF_WORKERS)
+    futures = [
+        _get_pool().submit(_extract_range, data, start, min(start + step, num_pages), backend)
+        for start in range(0, num_pages, step)
+    ]
+    return "".join(text for future in futures for text in future.result())
@@ -0,0 +1,212 @@
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+
+import requests
+from cachetools import LRUCache
+
+from utils.config import env_float, env_int
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+LEETCODE_API_URL = os.getenv("LEETCODE_API_URL", "https://leetcode-stats-api.herokuapp.com")
+# Upper bound on how long PDF generation waits for both profiles together
+PROFILE_STATS_TIMEOUT = env_float("PROFILE_STATS_TIMEOUT", 5)
+PROFILE_STATS_TTL = env_int("PROFILE_STATS_TTL", 3600)
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_PER_PAGE = 100
+# Bounded pool shared by repo page requests and per-repo language requests
+GITHUB_WORKERS = env_int("GITHUB_WORKERS", 8)
+# Rank languages by bytes of code (one extra request per repo, cached per push) instead of by repo count
+GITHUB_LANGUAGE_BYTES = os.getenv("GITHUB_LANGUAGE_BYTES", "0") == "1"
+
+LEETCODE_FALLBACK = {"status": "error", "message": "Could not reach backend, try again later."}
+GITHUB_FALLBACK = {"total_repos": 0, "languages": []}
+
+
+class ProfileStatsError(Exception):
+    pass
+
+
+class _Entry:
+    __slots__ = ("value", "fetched", "etag", "payload")
+
+    def __init__(self, value, etag=None, payload=None):
+        self.value = value
+        self.fetched = time.time()
+        self.etag = etag
+        self.payload = payload
+
+
+class ProfileStatsClient:
+    """GitHub and LeetCode stats per username, fetched concurrently and cached.
+
+    Entries are fresh for ``ttl`` seconds. Past that they are revalidated: GitHub with an ETag
+    conditional request, so an unchanged profile costs a 304. If a fetch fails or misses the
+    deadline, the last value seen for that username is served instead.
+    """
+
+    def __init__(self, timeout=PROFILE_STATS_TIMEOUT, ttl=PROFILE_STATS_TTL, maxsize=1024,
+                 language_bytes=GITHUB_LANGUAGE_BYTES):
+        self.timeout = timeout
+        self.ttl = ttl
+        self.language_bytes = language_bytes
+        self.session = requests.Session()
+        self.session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=GITHUB_WORKERS + 2))
+        self.session.headers["Accept"] = "application/vnd.github+json"
+        if GITHUB_TOKEN:
+            self.session.headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+        self._cache = LRUCache(maxsize=maxsize)
+        self._languages = LRUCache(maxsize=maxsize * 16)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="profile-stats")
+        self._github_executor = ThreadPoolExecutor(max_workers=GITHUB_WORKERS, thread_name_prefix="github")
+
+    def _get(self, kind, username):
+        with self._lock:
+            return self._cache.get((kind, username.lower()))
+
+    def _put(self, kind, username, entry):
+        with self._lock:
+            self._cache[(kind, username.lower())] = entry
+
+    def _fresh(self, entry):
+        return entry is not None and time.time() - entry.fetched < self.ttl
+
+    def fetch_leetcode(self, username):
+        entry = self._get("leetcode", username)
+        if self._fresh(entry):
+            return entry.value
+        try:
+            response = self.session.get(f"{LEETCODE_API_URL}/{username}/", timeout=self.timeout)
+            stats = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise ProfileStatsError(f"Error fetching LeetCode stats: {e}") from e
+        if stats.get("status") == "error":
+            raise ProfileStatsError(f"Error fetching LeetCode stats: {stats.get('message', 'unknown error')}")
+        self._put("leetcode", username, _Entry(stats))
+        return stats
+
+    def _repos_page(self, username, page, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = self.session.get(
+                f"{GITHUB_API_URL}/users/{username}/repos",
+                params={"per_page": GITHUB_PER_PAGE, "page": page},
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            raise ProfileStatsError(f"Error fetching GitHub stats: {e}") from e
+        if response.status_code not in (200, 304):
+            raise ProfileStatsError(f"Error fetching GitHub stats: {response.status_code}")
+        return response
+
+    def fetch_github(self, username):
+        entry = self._get("github", username)
+        if self._fresh(entry):
+            return entry.value
+        # Every page keeps its own ETag, so revalidating an unchanged account is all 304s
+        known = entry.payload if entry is not None else {}
+
+        first = self._repos_page(username, 1, known.get(1, (None, None))[0])
+        pages = {1: self._page_result(first, known.get(1))}
+        last_page = _last_page(first.headers.get("Link"))
+        page_count_known = last_page is not None or first.status_code == 200
+        if last_page is None:
+            last_page = max(known) if first.status_code == 304 else 1
+        responses = self._github_executor.map(
+            lambda page: (page, self._repos_page(username, page, known.get(page, (None, None))[0])),
+            range(2, last_page + 1),
+        )
+        for page, response in responses:
+            pages[page] = self._page_result(response, known.get(page))
+        # Without a Link header the stored page count is used, which can be short after new repos were created
+        while not page_count_known and len(pages[last_page][1]) == GITHUB_PER_PAGE:
+            last_page += 1
+            pages[last_page] = self._page_result(self._repos_page(username, last_page), None)
+
+        repos = [repo for page in sorted(pages) for repo in pages[page][1]]
+        stats = github_stats_from_repos(repos, self.repo_languages(repos) if self.language_bytes else None)
+        self._put("github", username, _Entry(stats, payload=pages))
+        return stats
+
+    @staticmethod
+    def _page_result(response, known):
+        if response.status_code == 304:
+            return known
+        try:
+            return response.headers.get("ETag"), response.json()
+        except ValueError as e:
+            raise ProfileStatsError(f"Error fetching GitHub stats: invalid JSON response ({e})") from e
+
+    def _languages_for(self, repo):
+        key = (repo["full_name"], repo.get("pushed_at"))
+        with self._lock:
+            languages = self._languages.get(key)
+        if languages is None:
+            try:
+                response = self.session.get(repo["languages_url"], timeout=self.timeout)
+                response.raise_for_status()
+                languages = response.json()
+            except (requests.RequestException, ValueError):
+                # Fall back to the repo's primary language, uncached so the next run retries
+                return {repo["language"]: 1} if repo.get("language") else {}
+            with self._lock:
+                self._languages[key] = languages
+        return languages
+
+    def repo_languages(self, repos):
+        # Language bytes only change when a repo is pushed to, so results are cached per (repo, pushed_at)
+        totals = Counter()
+        for languages in self._github_executor.map(self._languages_for, repos):
+            totals.update(languages)
+        return totals
+
+    def fetch(self, leetcode_username, github_username):
+        # Both requests run at once, so the wait is bounded by the slower of the two and by the timeout
+        futures = {
+            "leetcode": self._executor.submit(self.fetch_leetcode, leetcode_username),
+            "github": self._executor.submit(self.fetch_github, github_username),
+        }
+        wait(futures.values(), timeout=self.timeout)
+        results, errors = {}, []
+        fallbacks = {
+            "leetcode": (leetcode_username, LEETCODE_FALLBACK),
+            "github": (github_username, GITHUB_FALLBACK),
+        }
+        for kind, future in futures.items():
+            username, fallback = fallbacks[kind]
+            try:
+                if not future.done():
+                    raise ProfileStatsError(f"Timed out fetching {kind} stats for {username}")
+                results[kind] = future.result()
+            except Exception as e:
+                # Any failure, not only ProfileStatsError, degrades to the cached value or the fallback
+                if not isinstance(e, ProfileStatsError):
+                    e = ProfileStatsError(f"Error fetching {kind} stats for {username}: {e!r}")
+                entry = self._get(kind, username)
+                if entry is None:
+                    errors.append(str(e))
+                results[kind] = entry.value if entry is not None else fallback
+        return results["leetcode"], results["github"], errors
+
+
+def _last_page(link_header):
+    match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', link_header or "")
+    return int(match.group(1)) if match else None
+
+
+def github_stats_from_repos(repos, language_bytes=None):
+    # Most used languages first: by bytes of code when measured, otherwise by number of repos
+    counts = language_bytes or Counter(repo['language'] for repo in repos if repo['language'])
+    languages = [language for language, _ in counts.most_common()]
+    return {"total_repos": len(repos), "languages": languages}
+
+
+@lru_cache(maxsize=None)
+def get_profile_stats_client():
+    return ProfileStatsClient()
@@ -0,0 +1,204 @@
+import argparse
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List
+
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
+
+from utils.config import cache_path, env_int
+
+QUESTIONS_PER_TEST = 5
+# Pools are topped up in the background once they drop below the low watermark
+QUESTION_BANK_TARGET = env_int("QUESTION_BANK_TARGET", 30)
+QUESTION_BANK_LOW_WATERMARK = env_int("QUESTION_BANK_LOW_WATERMARK", 15)
+# Generations a cold pool may take in the foreground before draw gives up
+QUESTION_BANK_COLD_ATTEMPTS = env_int("QUESTION_BANK_COLD_ATTEMPTS", 3)
+
+
+class Questions(BaseModel):
+    set_of_questions: List[str] = Field(description="List of questions to test the competence of the job seeker")
+
+
+def repair_questions(raw_message):
+    # Recover the question list from a malformed reply without asking the model again
+    candidates = [call.get("args") for call in getattr(raw_message, "tool_calls", [])]
+    candidates += [call.get("function", {}).get("arguments") for call in raw_message.additional_kwargs.get("tool_calls", [])]
+    candidates.append(raw_message.content)
+    for candidate in candidates:
+        if isinstance(candidate, dict):
+            questions = candidate.get("set_of_questions")
+            if isinstance(questions, list):
+                return Questions(set_of_questions=[str(q) for q in questions])
+            continue
+        if not candidate:
+            continue
+        match = re.search(r"\{.*\}|\[.*\]", candidate, re.DOTALL)
+        if match:
+            try:
+                data = json.loads(re.sub(r",\s*([\]}])", r"\1", match.group(0)))
+                questions = data.get("set_of_questions") if isinstance(data, dict) else data
+                if isinstance(questions, list):
+                    return Questions(set_of_questions=[str(q) for q in questions])
+            except json.JSONDecodeError:
+                pass
+        lines = [re.sub(r"^\s*(?:\d+[.)]|[-*•])\s*", "", line).strip() for line in candidate.splitlines()]
+        questions = [line for line in lines if line.endswith("?")]
+        if questions:
+            return Questions(set_of_questions=questions)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_question_model():
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model="gpt-4o-mini")
+
+
+def generate_question_set(job_role, work_experience, model=None):
+    system_template = (
+        "You are an intelligent competency diagnostic system. Ask a series of questions to the job seeker "
+        "to test their competence, and based on their scores, recommend jobs to them."
+    )
+    human_prompt = "Assume the given job seeker is a {job_role} with {work_experience} years of experience. Generate a set of 5 questions to test their competence."
+    prompt_template = ChatPromptTemplate.from_messages([("system", system_template), ("user", human_prompt)])
+    # One round trip: the model answers straight into the Questions schema
+    chain = prompt_template | (model or get_question_model()).with_structured_output(Questions, include_raw=True)
+
+    response = chain.invoke({"job_role": job_role, "work_experience": work_experience})
+    questions = response["parsed"] or repair_questions(response["raw"])
+    if questions is None:
+        raise ValueError(f"Could not extract questions: {response['parsing_error']}")
+    return questions.set_of_questions
+
+
+def normalize_role(job_role):
+    return " ".join(re.sub(r"[^a-z0-9+#]+", " ", job_role.lower()).split())
+
+
+def experience_bucket(work_experience):
+    match = re.search(r"\d+(?:\.\d+)?", str(work_experience))
+    if not match:
+        return "any"
+    years = float(match.group(0))
+    if years < 2:
+        return "0-1"
+    if years < 5:
+        return "2-4"
+    if years < 10:
+        return "5-9"
+    return "10+"
+
+
+class QuestionBank:
+    """Pools of pre-generated questions per (normalised role, experience bucket) in SQLite."""
+
+    def __init__(self, path, generate=generate_question_set):
+        self.generate = generate
+        self._lock = threading.Lock()
+        self._refilling = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="question-bank")
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS questions ("
+            "role TEXT NOT NULL, bucket TEXT NOT NULL, question TEXT NOT NULL, created REAL NOT NULL, "
+            "UNIQUE (role, bucket, question))"
+        )
+        self._conn.commit()
+
+    def pool(self, role, bucket):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT question FROM questions WHERE role = ? AND bucket = ?", (role, bucket)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _add(self, role, bucket, questions):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO questions (role, bucket, question, created) VALUES (?, ?, ?, ?)",
+                [(role, bucket, question.strip(), time.time()) for question in questions if question.strip()],
+            )
+            self._conn.commit()
+
+    def top_up(self, job_role, work_experience, target=QUESTION_BANK_TARGET):
+        role, bucket = normalize_role(job_role), experience_bucket(work_experience)
+        # Each generation yields a handful of questions; stop early if the model keeps repeating itself
+        for _ in range(max(1, 2 * target // QUESTIONS_PER_TEST)):
+            if len(self.pool(role, bucket)) >= target:
+                break
+            years = work_experience if bucket == "any" else bucket
+            self._add(role, bucket, self.generate(job_role, years))
+        return len(self.pool(role, bucket))
+
+    def _top_up_in_background(self, job_role, work_experience):
+        key = (normalize_role(job_role), experience_bucket(work_experience))
+        with self._lock:
+            if key in self._refilling:
+                return
+            self._refilling.add(key)
+
+        def run():
+            try:
+                self.top_up(job_role, work_experience)
+            finally:
+                with self._lock:
+                    self._refilling.discard(key)
+
+        self._executor.submit(run)
+
+    def draw(self, job_role, work_experience, k=QUESTIONS_PER_TEST):
+        role, bucket = normalize_role(job_role), experience_bucket(work_experience)
+        pool = self.pool(role, bucket)
+        # Cold pool: the first candidate pays for a generation or two, the rest is filled in the background
+        for _ in range(QUESTION_BANK_COLD_ATTEMPTS):
+            if len(pool) >= k:
+                break
+            years = work_experience if bucket == "any" else bucket
+            self._add(role, bucket, self.generate(job_role, years))
+            pool = self.pool(role, bucket)
+        if len(pool) < k:
+            raise ValueError(f"Only {len(pool)} of {k} questions could be generated for {job_role}")
+        if len(pool) < QUESTION_BANK_LOW_WATERMARK:
+            self._top_up_in_background(job_role, work_experience)
+        return random.sample(pool, k)
+
+
+@lru_cache(maxsize=None)
+def get_question_bank():
+    return QuestionBank(cache_path("question_bank.sqlite"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate interview question pools for a list of roles.")
+    parser.add_argument("roles", nargs="*", help="Job roles to warm up")
+    parser.add_argument("--roles-file", help="File with one job role per line")
+    parser.add_argument("--experience", nargs="+", default=["1", "3", "7", "12"],
+                        help="Years of experience to cover, one per bucket")
+    parser.add_argument("--target", type=int, default=QUESTION_BANK_TARGET, help="Questions to keep per pool")
+    args = parser.parse_args()
+
+    roles = list(args.roles)
+    if args.roles_file:
+        with open(args.roles_file, encoding="utf-8") as f:
+            roles.extend(line.strip() for line in f if line.strip())
+    if not roles:
+        parser.error("give at least one role or --roles-file")
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    bank = get_question_bank()
+    for role in roles:
+        for years in args.experience:
+            size = bank.top_up(role, years, args.target)
+            print(f"{normalize_role(role)} [{experience_bucket(years)}]: {size} questions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from utils.config import env_int
+from utils.profile_stats import (GITHUB_FALLBACK, LEETCODE_FALLBACK, ProfileStatsError,
+                                 get_profile_stats_client)
+from utils.resume_pdf import create_resume_pdf
+
+# The same fields the Resume Builder form collects; list fields hold one entry per line
+TEXT_FIELDS = ["name", "email", "phone", "address"]
+LIST_FIELDS = ["education", "experience", "skills", "hobbies", "languages"]
+USERNAME_FIELDS = ["leetcode_username", "github_username"]
+RESUME_BATCH_WORKERS = env_int("RESUME_BATCH_WORKERS", os.cpu_count() or 1)
+STATS_FETCH_WORKERS = env_int("STATS_FETCH_WORKERS", 16)
+
+
+def read_records(path):
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def normalize_record(record):
+    record = dict(record)
+    for field in LIST_FIELDS:
+        value = record.get(field) or []
+        record[field] = value.split("\n") if isinstance(value, str) else [str(item) for item in value]
+    missing = [field for field in TEXT_FIELDS + LIST_FIELDS + USERNAME_FIELDS if not record.get(field)]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    return record
+
+
+def stub_stats(kind, username):
+    # Deterministic offline stand-ins shaped like the real API responses
+    seed = sum(map(ord, username))
+    if kind == "leetcode":
+        return {"status": "success", "totalSolved": seed % 500, "easySolved": seed % 200, "totalEasy": 800,
+                "mediumSolved": seed % 250, "totalMedium": 1700, "hardSolved": seed % 50, "totalHard": 700}
+    languages = ["Python", "JavaScript", "Go", "Java", "C++"]
+    return {"total_repos": seed % 120, "languages": languages[:1 + seed % len(languages)]}
+
+
+def fetch_all_stats(records, stub=False):
+    # Each distinct username is fetched once however many records share it
+    wanted = sorted({("leetcode", r["leetcode_username"]) for r in records} | {("github", r["github_username"]) for r in records})
+    client = get_profile_stats_client()
+    fetchers = {"leetcode": client.fetch_leetcode, "github": client.fetch_github}
+    fallbacks = {"leetcode": LEETCODE_FALLBACK, "github": GITHUB_FALLBACK}
+
+    def fetch(key):
+        kind, username = key
+        if stub:
+            return key, stub_stats(kind, username), None
+        try:
+            return key, fetchers[kind](username), None
+        except Exception as e:
+            # One bad username falls back to the placeholder stats instead of aborting the batch
+            return key, fallbacks[kind], str(e) if isinstance(e, ProfileStatsError) else repr(e)
+
+    with ThreadPoolExecutor(max_workers=STATS_FETCH_WORKERS) as executor:
+        results = list(executor.map(fetch, wanted))
+    return {key: stats for key, stats, _ in results}, [f"{key[1]}: {error}" for key, _, error in results if error]
+
+
+def file_name(index, record):
+    slug = re.sub(r"[^a-z0-9]+", "-", record["name"].lower()).strip("-") or "resume"
+    return f"{index:05d}-{slug}.pdf"
+
+
+# Runs in worker processes; returns the bytes so only the parent touches the output.
+# A record that fails to render comes back with pdf None and the error, so the rest of the batch carries on.
+def render_record(job):
+    index, record, leetcode_stats, github_stats = job
+    start = time.perf_counter()
+    try:
+        pdf = create_resume_pdf(
+            record["name"], record["email"], record["phone"], record["address"],
+            record["education"], record["experience"], record["skills"],
+            record["hobbies"], record["languages"], leetcode_stats, github_stats
+        )
+        error = None
+    except Exception as e:
+        pdf, error = None, f"{type(e).__name__}: {e}"
+    return index, file_name(index, record), pdf, time.perf_counter() - start, error
+
+
+class _Output:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.zip = None
+        if self.path.suffix.lower() == ".zip":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # PDFs are already compressed, so entries are stored as-is
+            self.zip = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_STORED)
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name, data):
+        if self.zip is not None:
+            self.zip.writestr(name, data)
+        else:
+            (self.path / name).write_bytes(data)
+
+    def close(self):
+        if self.zip is not None:
+            self.zip.close()
+
+
+def run_batch(records, output, workers=RESUME_BATCH_WORKERS, stub=False):
+    timings, errors = [], []
+    valid = []
+    for index, record in enumerate(records, start=1):
+        try:
+            valid.append((index, normalize_record(record)))
+        except ValueError as e:
+            timings.append({"index": index, "name": record.get("name", ""), "file": "", "render_ms": "", "status": f"skipped: {e}"})
+
+    start = time.perf_counter()
+    stats, stat_errors = fetch_all_stats([record for _, record in valid], stub)
+    fetch_seconds = time.perf_counter() - start
+    errors.extend(stat_errors)
+
+    jobs = [
+        (index, record, stats[("leetcode", record["leetcode_username"])], stats[("github", record["github_username"])])
+        for index, record in valid
+    ]
+    names = dict(valid)
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) if workers > 1 else None
+    out = _Output(output)
+    start = time.perf_counter()
+    try:
+        results = pool.map(render_record, jobs, chunksize=max(1, len(jobs) // (workers * 8))) if pool else map(render_record, jobs)
+        rendered = 0
+        for index, name, pdf, seconds, error in results:
+            if error:
+                errors.append(f"{names[index]['name']}: {error}")
+                timings.append({"index": index, "name": names[index]["name"], "file": "",
+                                "render_ms": f"{seconds * 1000:.1f}", "status": f"failed: {error}"})
+                continue
+            out.write(name, pdf)
+            rendered += 1
+            timings.append({"index": index, "name": names[index]["name"], "file": name,
+                            "render_ms": f"{seconds * 1000:.1f}", "status": "ok"})
+        render_seconds = time.perf_counter() - start
+
+        report = io.StringIO()
+        writer = csv.DictWriter(report, fieldnames=["index", "name", "file", "render_ms", "status"])
+        writer.writeheader()
+        writer.writerows(sorted(timings, key=lambda row: row["index"]))
+        out.write("timings.csv", report.getvalue().encode("utf-8"))
+    finally:
+        out.close()
+        if pool:
+            pool.shutdown()
+    return {"rendered": rendered, "skipped": len(records) - len(valid), "failed": len(jobs) - rendered,
+            "fetch_seconds": fetch_seconds,
+            "render_seconds": render_seconds, "errors": errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate resume PDFs for a batch of candidates.")
+    parser.add_argument("records", help="CSV or JSONL file with the Resume Builder form fields per candidate")
+    parser.add_argument("--out", default="resumes.zip", help="Output .zip file or directory")
+    parser.add_argument("--workers", type=int, default=RESUME_BATCH_WORKERS, help="Rendering processes")
+    parser.add_argument("--stub-stats", action="store_true", help="Use offline GitHub/LeetCode stand-ins")
+    args = parser.parse_args()
+
+    records = read_records(args.records)
+    summary = run_batch(records, args.out, args.workers, args.stub_stats)
+    for error in summary["errors"]:
+        print(error)
+    rate = summary["rendered"] / summary["render_seconds"] if summary["render_seconds"] else 0
+    print(f"{summary['rendered']} rendered, {summary['skipped']} skipped, {summary['failed']} failed -> {args.out}")
+    print(f"stats {summary['fetch_seconds']:.2f} s, render {summary['render_seconds']:.2f} s "
+          f"({rate:.1f} resumes/s on {args.workers} worker(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (HRFlowable, Paragraph, SimpleDocTemplate,
+                                Spacer, Table, TableStyle)
+
+COLUMN_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+])
+
+
+# Paragraph styles are built once per process and shared by every render
+@lru_cache(maxsize=None)
+def get_resume_styles():
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'TitleStyle', parent=styles['Title'], fontName='Helvetica-Bold', fontSize=24, alignment=TA_CENTER
+        ),
+        "subtitle": ParagraphStyle(
+            'SubtitleStyle', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=14, spaceAfter=12, alignment=TA_LEFT
+        ),
+        "content": ParagraphStyle(
+            'ContentStyle', parent=styles['Normal'], fontName='Helvetica', fontSize=12, spaceAfter=10, leading=14
+        ),
+        "header": ParagraphStyle(
+            'HeaderStyle', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=10, spaceAfter=10, alignment=TA_CENTER
+        ),
+    }
+
+
+# Renders the resume into memory and returns the PDF bytes
+def create_resume_pdf(name, email, phone, address, education, experience, skills, hobbies, languages, leetcode_stats, github_stats):
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = get_resume_styles()
+    title_style = styles["title"]
+    subtitle_style = styles["subtitle"]
+    content_style = styles["content"]
+    header_style = styles["header"]
+
+    # Paragraph parses its text as markup, so user input such as "R&D <Lead" must be escaped first
+    name, email, phone, address = (escape(value) for value in (name, email, phone, address))
+
+    content = []
+    content.append(Paragraph(name, title_style))
+    content.append(Spacer(1, 6))
+    contact_info = f"{email} &nbsp;&nbsp;|&nbsp;&nbsp; {phone}|&nbsp;&nbsp;{address}"
+    contact_info = contact_info.replace("\n", ", ")
+    contact_info = Paragraph(contact_info, header_style)
+    content.append(contact_info)
+    content.append(HRFlowable(width="100%", thickness=1, color="black"))
+    content.append(Spacer(1, 12))
+
+    def add_section(title, items, bullet=True):
+        section = []
+        section.append(Paragraph(title, subtitle_style))
+        section.append(HRFlowable(width="40%", thickness=1, color="black", spaceAfter=6))
+        for item in map(escape, items):
+            if bullet:
+                section.append(Paragraph(f"• {item}", content_style))
+            else:
+                section.append(Paragraph(item, content_style))
+        section.append(Spacer(1, 12))
+        return section
+
+    # Left half: Education, Work Experience, Hobbies
+    left_column = []
+    left_column.extend(add_section("Education", education, False))
+    left_column.extend(add_section("Work Experience", experience, False))
+    left_column.extend(add_section("Hobbies", hobbies))
+
+    # Right half: Skills, GitHub Stats, LeetCode Stats, Languages
+    right_column = []
+    right_column.extend(add_section("Skills", skills))
+    
+    # GitHub Stats
+    github_stats_section = [
+        f"Total Repositories: {github_stats.get('total_repos', 'N/A')}",
+        f"Primary Languages: {', '.join(github_stats.get('languages', []))}",
+    ]
+    right_column.extend(add_section("GitHub Stats", github_stats_section, False))
+    
+    # LeetCode Stats
+    leetcode_stats_section = [
+        f"Total Problems Solved: {leetcode_stats.get('totalSolved', 'N/A')}",
+        f"Easy Problems Solved: {leetcode_stats.get('easySolved', 'N/A')} / {leetcode_stats.get('totalEasy', 'N/A')}",
+        f"Medium Problems Solved: {leetcode_stats.get('mediumSolved', 'N/A')} / {leetcode_stats.get('totalMedium', 'N/A')}",
+        f"Hard Problems Solved: {leetcode_stats.get('hardSolved', 'N/A')} / {leetcode_stats.get('totalHard', 'N/A')}",
+    ]
+    right_column.extend(add_section("LeetCode Stats", leetcode_stats_section, False))
+    right_column.extend(add_section("Languages", languages))
+
+    # Combine both columns into a table layout
+    data = [[left_column, right_column]]
+
+    table = Table(data, colWidths=[3.5 * inch, 3.5 * inch])
+    table.setStyle(COLUMN_TABLE_STYLE)
+
+    content.append(table)
+    doc.build(content)
+
+    return buffer.getvalue()
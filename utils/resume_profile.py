@@ -0,0 +1,104 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import streamlit as st
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from utils.config import CACHE_DIR, atomic_write, env_int
+from utils.embedding_cache import embedding_model_name
+from utils.pdf_text import get_pdf_text, read_pdf_bytes
+
+RESUME_PROFILE_TTL = env_int("RESUME_PROFILE_TTL", 7 * 24 * 3600)
+RESUME_PROFILE_MAX_ENTRIES = env_int("RESUME_PROFILE_MAX_ENTRIES", 256)
+PROFILE_DIR = CACHE_DIR / "resume_profiles"
+# Profiles are shared between session threads; guards their embeddings/skills dicts and the pickling of them
+_profile_lock = threading.RLock()
+
+
+@dataclass
+class ResumeProfile:
+    digest: str
+    text: str
+    chunks: list
+    # Embedding matrices keyed by embedding model, extracted skills keyed by LLM
+    embeddings: dict = field(default_factory=dict)
+    skills: dict = field(default_factory=dict)
+
+
+def get_text_chunks(text):
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=750,
+        chunk_overlap=50,
+        length_function=len
+    )
+    chunks = text_splitter.split_text(text)
+    return chunks
+
+
+def _profile_path(digest):
+    return PROFILE_DIR / f"{digest}.pkl"
+
+
+def _load_from_disk(digest):
+    path = _profile_path(digest)
+    try:
+        if time.time() - path.stat().st_mtime > RESUME_PROFILE_TTL:
+            path.unlink(missing_ok=True)
+            return None
+        with open(path, "rb") as f:
+            profile = pickle.load(f)
+        # mtime doubles as the LRU clock
+        os.utime(path)
+        return profile
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save_resume_profile(profile):
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    with _profile_lock:
+        data = pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL)
+    atomic_write(_profile_path(profile.digest), lambda tmp: tmp.write_bytes(data))
+
+    entries = sorted(PROFILE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+    for stale in entries[:max(0, len(entries) - RESUME_PROFILE_MAX_ENTRIES)]:
+        stale.unlink(missing_ok=True)
+
+
+@st.cache_resource(max_entries=64, ttl=RESUME_PROFILE_TTL, show_spinner=False)
+def _cached_profile(digest, _data):
+    profile = _load_from_disk(digest)
+    if profile is None:
+        text = get_pdf_text(_data)
+        profile = ResumeProfile(digest, text, get_text_chunks(text))
+        save_resume_profile(profile)
+    return profile
+
+
+# Parsed resume shared by every page, keyed by the SHA-256 of the uploaded bytes
+def load_resume_profile(pdf):
+    data = read_pdf_bytes(pdf)
+    return _cached_profile(hashlib.sha256(data).hexdigest(), data)
+
+
+def profile_embeddings(profile, embedding):
+    model = embedding_model_name(getattr(embedding, "embedding", embedding))
+    if model not in profile.embeddings:
+        vectors = embedding.embed_documents(profile.chunks) if profile.chunks else []
+        with _profile_lock:
+            profile.embeddings.setdefault(model, np.asarray(vectors, dtype=np.float32))
+        save_resume_profile(profile)
+    return profile.embeddings[model]
+
+
+def set_profile_skills(profile, model, skills):
+    # The first extraction stored for a model wins, so concurrent sessions agree on one answer
+    with _profile_lock:
+        skills = profile.skills.setdefault(model, skills)
+    save_resume_profile(profile)
+    return skills
@@ -0,0 +1,48 @@
+from langchain_core.callbacks import BaseCallbackHandler
+
+# langchain-core has no public way to request streaming from invoke() that every provider accepts:
+# OpenAI honours streaming=True, Gemini ignores it and rejects a stream=True call kwarg. Chat models
+# do stream whenever a handler subclasses this marker, but it is private, so langchain-core is
+# pinned in requirements.txt and tests/test_streaming.py fails if an upgrade moves or drops it.
+try:
+    from langchain_core.tracers._streaming import _StreamingCallbackHandler
+    STREAMING_MARKER = True
+except ImportError:
+    class _StreamingCallbackHandler:
+        pass
+    STREAMING_MARKER = False
+
+
+class StreamHandler(BaseCallbackHandler, _StreamingCallbackHandler):
+    """Renders LLM tokens into a Streamlit placeholder as they arrive.
+
+    Subclassing LangChain's streaming marker makes ``invoke`` use the model's ``_stream`` for any
+    chat model (OpenAI, Gemini or a fake), so no per-provider ``streaming`` flag is needed. Without
+    the marker the handler still renders tokens from models created with ``streaming=True``.
+    Tokens are dropped while no container is attached, so a chain can be built once and only
+    stream the calls whose answer is shown to the user.
+    """
+
+    def __init__(self, container=None):
+        self.container = container
+        self.tokens = []
+        self._last_chunk = None
+
+    def attach(self, container):
+        self.container = container
+        self.tokens = []
+
+    def on_llm_new_token(self, token: str, *, chunk=None, **kwargs) -> None:
+        # LangChain reports every streamed chunk with the chunk attached, and some providers report
+        # it a second time from their own _stream; count each chunk exactly once
+        if self.container is None or chunk is None or chunk is self._last_chunk:
+            return
+        self._last_chunk = chunk
+        self.tokens.append(token)
+        self.container.markdown("".join(self.tokens) + "▌")
+
+    def tap_output_iter(self, run_id, output):
+        return output
+
+    def tap_output_aiter(self, run_id, output):
+        return output
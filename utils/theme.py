@@ -0,0 +1,254 @@
+import gzip
+import json
+import re
+import threading
+from functools import lru_cache
+
+import requests
+import streamlit as st
+from cachetools import TTLCache, cached
+
+from utils.config import ROOT_DIR
+
+ASSETS_DIR = ROOT_DIR / "assets"
+
+# Dark theme shared by every page
+BASE_CSS = """
+    [data-testid="stHeader"] {
+        background: rgba(0,0,0,0);
+    }
+   
+    /* Background and text styling to match the animation theme */
+    [data-testid="stAppViewContainer"] {
+        background-color: #1e1e2f; /* Dark background to match the animation */
+        color: #f0f0f7; /* Light text color for contrast */
+    }
+    h1, h2, h3, h4, h5, h6, p, a, label {
+        color: #f0f0f7 !important; /* Light color for headers and text */
+    }
+     [data-testid="stSidebarCollapseButton"]{
+        background-color: #304463; /* Bright button color */
+        color: #ffffff; /* White text on buttons */
+        
+    }
+    [data-testid="stSidebarContent"]{
+        background-color: #304463; /* Bright button color */
+        color: #ffffff; /* White text on buttons */
+        
+    }
+    .st-emotion-cache-1itdyc2{
+       background-color: #304463; 
+    }
+       [data-testid="stSidebarNav"] {
+        background-color: #304463; /* Dark background for sidebar */
+        ; /* Add padding around the sidebar */
+        border-radius: 10px; /* Rounded corners for a smooth look */
+    }
+
+    /* Styling each navigation link */
+    [data-testid="stSidebarNavLink"] {
+        background-color:black; /* Darker background for each link */
+        color: #f0f0f7 !important; /* Light text color */
+        padding: 12px 20px; /* Add padding to the links */
+        border-radius: 8px; /* Rounded corners for links */
+        text-decoration: none; /* Remove underline */
+        display: block; /* Make the link take full width */
+        margin-bottom: 10px; /* Space between links */
+        transition: background-color 0.3s ease; /* Smooth transition */
+    }
+.st-emotion-cache-6qob1r {
+    position: relative;
+    height: 100%;
+    width: 100%;
+    overflow: overlay;}
+    /* Styling the hover effect on the navigation links */
+    [data-testid="stSidebarNavLink"]:hover {
+        background-color: #3d3d5c; /* Slightly lighter background on hover */
+    }
+
+    /* Styling the text inside the navigation links */
+    [data-testid="stSidebarNavLink"] span {
+        font-weight: bold; /* Make the text bold */
+        font-size: 16px; /* Slightly larger font size */
+    }
+
+    /* Remove the default list style */
+    [data-testid="stSidebarNavItems"] {
+        list-style-type: none;
+        padding: 0;
+    }
+    /* Scrollbar styling */
+    ::-webkit-scrollbar {
+        width: 12px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: #2e2e3e;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background-color: #555555;
+        border-radius: 6px;
+        border: 3px solid #2e2e3e;
+    }
+    .MuiBox-root ,.css-0{
+    background-color:#1e1e2f;
+    }
+    
+"""
+
+# Home page extras: accent buttons and transparent columns around the animation
+HOME_CSS = """
+    [data-testid="stHeader"] {
+        background: rgba(0,0,0,0);
+    }
+    /* Background and text styling to match the animation theme */
+    [data-testid="stAppViewContainer"] {
+        background-color: #1e1e2f; /* Dark background to match the animation */
+        color: #f0f0f7; /* Light text color for contrast */
+        padding: 20px; /* Adding some padding for breathing space */
+    }
+    h1, h2, h3, h4, h5, h6, p, a, label {
+        color: #f0f0f7 !important; /* Light color for headers and text */
+    }
+    .stButton>button {
+        background-color: #ff4b4b; /* Bright button color */
+        color: #ffffff; /* White text on buttons */
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 16px;
+    }
+    #root {
+        background-color: #1e1e2f; /* Dark background */
+        padding: 20px;
+    }
+    .stButton>button:hover {
+        background-color: #ff7c7c; /* Lighter on hover */
+    }
+    [data-testid="stSidebarContent"]{
+        background-color: #304463; /* Bright button color */
+        color: #ffffff; /* White text on buttons */
+        
+    }
+    .st-markdown {
+        font-size: 18px; /* Larger font size for readability */
+        line-height: 1.6; /* Better line spacing */
+    }
+    /* Targeting SVG inside the #root div */
+    #root div svg {
+        background-color: #1e1e2f; /* Set background color of SVG */
+        border-radius: 8px; /* Optional: adds rounded corners */
+        padding: 10px; /* Optional: adds padding inside the SVG */
+    }
+    [data-testid="column"] {
+background-color: transparent !important;
+}
+    
+"""
+
+# Resume Builder extras: form width, input fields and full-width buttons
+RESUME_CSS = """
+    /* Styling the hover effect on the navigation links */
+    [data-testid="stSidebarNavLink"]:hover {
+        background-color: #304463; /* Slightly lighter background on hover */
+    }
+    /* App background */
+    .stApp {
+        background-color: #1e1e2f;
+    }
+    .stForm{
+    width:700px;
+    }
+    /* Header styling */
+    [data-testid="stHeader"] {
+        background: rgba(0,0,0,0);
+        color: #ffffff;
+    }
+    
+    /* Text input fields */
+    .stTextInput>div>div>input, .stTextArea>div>div>textarea {
+        background-color: #2e2e3e;
+        color: #ffffff;
+        border: 1px solid #555555;
+        border-radius: 5px;
+    }
+    
+    /* Labels and headings */
+    .stMarkdown, h1, h2, h3, h4, h5, h6 {
+        color: #ffffff;
+    }
+    
+    /* Buttons */
+    .stButton>button {
+        background-color: #ff6b6b;
+        color: white;
+        border-radius: 5px;
+        height: 3em;
+        width: 100%;
+    }
+    .stButton>button:hover {
+        background-color: #ff4c4c;
+    }
+    
+    /* Markdown text */
+    .stMarkdown p {
+        color: #ffffff;
+    }
+    
+    /* Containers and other elements */
+    .st-b7, .st-bc {
+        background-color: #2e2e3e;
+        color: #ffffff;
+    }
+    
+    /* Form sections */
+    .st-emotion-cache-qcpnpn {
+        border: 2px solid #555555;
+        border-radius: 10px;
+        padding: 10px;
+    }
+"""
+
+THEME_EXTRAS = {"home": HOME_CSS, "resume": RESUME_CSS}
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    css = re.sub(r";+", ";", css)
+    return css.replace("{;", "{").replace(";}", "}").strip()
+
+
+# Minified once per process; reruns only send the cached string
+@lru_cache(maxsize=None)
+def theme_css(*extras):
+    css = BASE_CSS + "".join(THEME_EXTRAS[extra] for extra in extras)
+    return f"<style>{minify_css(css)}</style>"
+
+
+def apply_theme(*extras):
+    st.markdown(theme_css(*extras), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=None)
+def load_lottie(name):
+    # Assets ship gzipped next to the code, so the home page reads ~10x fewer bytes at start-up
+    with gzip.open(ASSETS_DIR / f"{name}.json.gz", "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@cached(TTLCache(maxsize=32, ttl=3600), lock=threading.Lock())
+def _fetch_json(url, timeout):
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def load_url(url: str, timeout=5):
+    # Successful responses are kept for an hour; failures are not cached, so the next call retries
+    try:
+        return _fetch_json(url, timeout)
+    except (requests.RequestException, ValueError):
+        return None
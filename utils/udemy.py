@@ -0,0 +1,151 @@
+import asyncio
+import base64
+import os
+import random
+import threading
+import time
+import weakref
+from functools import lru_cache
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.config import env_float, env_int
+
+UDEMY_API_URL = os.getenv("UDEMY_API_URL", "https://www.udemy.com/api-2.0/courses/")
+UDEMY_TIMEOUT = env_float("UDEMY_TIMEOUT", 10)
+UDEMY_MAX_RETRIES = env_int("UDEMY_MAX_RETRIES", 3)
+UDEMY_BACKOFF = env_float("UDEMY_BACKOFF", 0.5)
+UDEMY_POOL_SIZE = env_int("UDEMY_POOL_SIZE", 16)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class UdemyAPIError(Exception):
+    def __init__(self, status, query):
+        super().__init__(f"Failed to fetch courses: {status}")
+        self.status = status
+        self.query = query
+
+
+def get_auth_header(client_id, client_secret):
+    auth_str = f"{client_id}:{client_secret}"
+    auth_bytes = auth_str.encode("ascii")
+    auth_base64 = base64.b64encode(auth_bytes).decode("ascii")
+    return {"Authorization": f"Basic {auth_base64}"}
+
+
+# Full-jitter exponential backoff, deferring to the server's Retry-After when it sends one
+def _backoff_delay(attempt, retry_after=None):
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return random.uniform(0, UDEMY_BACKOFF * 2 ** attempt)
+
+
+class UdemyClient:
+    """Course search over one pooled keep-alive session, with sync and async entry points."""
+
+    def __init__(self, client_id, client_secret, base_url=UDEMY_API_URL, timeout=UDEMY_TIMEOUT,
+                 max_retries=UDEMY_MAX_RETRIES):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.auth_header = get_auth_header(client_id, client_secret)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.auth_header)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=UDEMY_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._async_sessions = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    @staticmethod
+    def _params(query, fields, page_size):
+        return {
+            "search": query,
+            "page": 1,
+            "page_size": page_size,
+            "fields[course]": fields
+        }
+
+    def search_courses(self, query="", fields="", page_size=5):
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.get(self.base_url, params=self._params(query, fields, page_size), timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise UdemyAPIError(type(e).__name__, query) from e
+                time.sleep(_backoff_delay(attempt))
+                continue
+            if response.status_code == 200:
+                try:
+                    return response.json()
+                except ValueError as e:
+                    raise UdemyAPIError("invalid JSON response", query) from e
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                raise UdemyAPIError(response.status_code, query)
+            time.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
+
+    def _aiohttp_session(self):
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=self.auth_header,
+                connector=aiohttp.TCPConnector(limit=UDEMY_POOL_SIZE, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    async def search_courses_async(self, query="", fields="", page_size=5):
+        session = self._aiohttp_session()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(self.base_url, params=self._params(query, fields, page_size)) as response:
+                    if response.status == 200:
+                        try:
+                            return await response.json(content_type=None)
+                        except ValueError as e:
+                            raise UdemyAPIError("invalid JSON response", query) from e
+                    retry_after = response.headers.get("Retry-After")
+                    if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                        raise UdemyAPIError(response.status, query)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise UdemyAPIError(type(e).__name__, query) from e
+                retry_after = None
+            await asyncio.sleep(_backoff_delay(attempt, retry_after))
+
+    def _background_loop(self):
+        # A long-lived loop keeps the aiohttp connection pool alive across Streamlit reruns
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="udemy-client", daemon=True).start()
+        return self._loop
+
+    def search_many(self, queries, fields="", page_size=5):
+        async def gather():
+            return await asyncio.gather(
+                *(self.search_courses_async(query, fields, page_size) for query in queries),
+                return_exceptions=True,
+            )
+
+        return asyncio.run_coroutine_threadsafe(gather(), self._background_loop()).result()
+
+
+# Process-wide client, or None when the Udemy credentials are not configured
+@lru_cache(maxsize=None)
+def get_udemy_client():
+    client_id = os.getenv("UDEMY_CLIENT_ID")
+    client_secret = os.getenv("UDEMY_CLIENT_SECRET")
+    if not (client_id and client_secret):
+        return None
+    return UdemyClient(client_id, client_secret)
@@ -0,0 +1,113 @@
+import os
+import shutil
+import uuid
+from contextlib import contextmanager, suppress
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from utils.config import CACHE_DIR
+
+# "numpy" keeps the resume in memory; "deeplake" is kept for large corpora
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "numpy")
+
+
+class NumpyVectorStore(VectorStore):
+    """In-memory store holding unit-normalised embeddings in one contiguous float32 matrix."""
+
+    def __init__(self, embedding):
+        self.embedding = embedding
+        self.ids: List[str] = []
+        self.texts: List[str] = []
+        self.metadatas: List[dict] = []
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+
+    @property
+    def embeddings(self):
+        return self.embedding
+
+    @staticmethod
+    def _normalize(vectors):
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def add_vectors(self, texts, vectors, metadatas=None, ids=None):
+        texts = list(texts)
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in texts]
+        vectors = self._normalize(vectors).reshape(len(texts), -1)
+        self.matrix = vectors if not self.texts else np.ascontiguousarray(np.vstack([self.matrix, vectors]))
+        self.texts.extend(texts)
+        self.metadatas.extend(metadatas or [{} for _ in texts])
+        self.ids.extend(ids)
+        return ids
+
+    def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None, **kwargs: Any) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        vectors = self.embedding.embed_documents(texts)
+        return self.add_vectors(texts, vectors, metadatas, kwargs.get("ids"))
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4) -> List[Tuple[Document, float]]:
+        if not self.texts:
+            return []
+        query = self._normalize(embedding)
+        scores = self.matrix @ query
+        k = min(k, len(self.texts))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (Document(page_content=self.texts[i], metadata=self.metadatas[i]), float(scores[i]))
+            for i in top
+        ]
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k)]
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def _select_relevance_score_fn(self):
+        # Cosine similarity in [-1, 1] mapped onto [0, 1]
+        return lambda score: (score + 1.0) / 2.0
+
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding, metadatas: Optional[List[dict]] = None, **kwargs: Any):
+        store = cls(embedding)
+        store.add_texts(texts, metadatas, **kwargs)
+        return store
+
+
+# Builds the retriever backing store for a list of resume chunks
+def build_vectorstore(text_chunks, embedding, dataset_path=None, vectors=None):
+    if VECTOR_STORE_BACKEND == "deeplake":
+        from langchain_community.vectorstores import DeepLake
+        return DeepLake.from_texts(text_chunks, dataset_path=dataset_path, embedding=embedding)
+    if vectors is not None and len(vectors):
+        vectorstore = NumpyVectorStore(embedding)
+        vectorstore.add_vectors(text_chunks, vectors)
+        return vectorstore
+    return NumpyVectorStore.from_texts(text_chunks, embedding)
+
+
+# Store private to one request: DeepLake datasets get their own directory, removed even if the request fails
+@contextmanager
+def session_vectorstore(text_chunks, embedding, vectors=None):
+    dataset_path = None
+    if VECTOR_STORE_BACKEND == "deeplake":
+        dataset_path = str(CACHE_DIR / "deeplake" / uuid.uuid4().hex)
+    try:
+        yield build_vectorstore(text_chunks, embedding, dataset_path, vectors)
+    finally:
+        if dataset_path:
+            from langchain_community.vectorstores import DeepLake
+            with suppress(Exception):
+                DeepLake.force_delete_by_path(dataset_path)
+            shutil.rmtree(dataset_path, ignore_errors=True)